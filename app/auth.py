@@ -1,4 +1,25 @@
+"""API key authentication.
+
+Keys are loaded once into an in-memory registry keyed by SHA-256 digest, so
+verifying a request is one hash plus one dict lookup. Several keys can be
+active at once, each with a label, which makes rotation a matter of adding
+the new key, moving clients over, then removing the old one:
+
+- ``GDEV_API_TOKEN``: a single plaintext key (label ``default``)
+- ``GDEV_API_KEYS``: comma-separated ``label:sha256hex`` entries
+- ``GDEV_API_KEYS_FILE``: a file of ``label:sha256hex`` lines (``#`` comments
+  allowed), re-read when its mtime changes; checked at most every
+  ``GDEV_API_KEYS_RELOAD_SECONDS`` (default 30)
+
+Print the digest to configure for a key with ``python -m app.auth <key>``.
+"""
+
+import hashlib
 import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
 
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
@@ -6,12 +27,94 @@ from fastapi.security import APIKeyHeader
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=True)
 
 
-def verify_api_key(api_key: str = Security(api_key_header)) -> str:
-    expected = os.getenv("GDEV_API_TOKEN", "")
-    if not expected or api_key != expected:
+def hash_api_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _parse_entries(entries, source: str) -> Dict[bytes, str]:
+    keys = {}
+    for entry in entries:
+        entry = entry.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        label, sep, digest_hex = entry.rpartition(":")
+        try:
+            digest = bytes.fromhex(digest_hex.strip())
+        except ValueError:
+            digest = b""
+        if not sep or len(digest) != hashlib.sha256().digest_size:
+            raise ValueError(f"Invalid API key entry in {source}: expected label:sha256hex")
+        keys[digest] = label.strip()
+    return keys
+
+
+class APIKeyRegistry:
+    """Active API keys by SHA-256 digest, with mtime-based reloads of the key file."""
+
+    def __init__(self):
+        self._keys: Dict[bytes, str] = {}
+        self._lock = threading.Lock()
+        self._file_mtime: Optional[float] = None
+        self._next_check = 0.0
+        self.reload_interval = float(os.getenv("GDEV_API_KEYS_RELOAD_SECONDS", "30"))
+        self.reload()
+
+    def reload(self) -> None:
+        """Rebuild the registry from the environment and the key file."""
+        keys = {}
+        token = os.getenv("GDEV_API_TOKEN", "")
+        if token:
+            digest = hashlib.sha256(token.encode()).digest()
+            keys[digest] = "default"
+        keys.update(_parse_entries(os.getenv("GDEV_API_KEYS", "").split(","), "GDEV_API_KEYS"))
+
+        path = os.getenv("GDEV_API_KEYS_FILE")
+        mtime = None
+        if path:
+            mtime = os.stat(path).st_mtime
+            with open(path) as fh:
+                keys.update(_parse_entries(fh, path))
+
+        with self._lock:
+            self._keys = keys
+            self._file_mtime = mtime
+            self._next_check = time.monotonic() + self.reload_interval
+
+    def _reload_if_changed(self) -> None:
+        path = os.getenv("GDEV_API_KEYS_FILE")
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_interval
+        try:
+            if path and os.stat(path).st_mtime != self._file_mtime:
+                self.reload()
+        except (OSError, ValueError):
+            # Keep serving the last good key set if the file is mid-rotation
+            pass
+
+    def verify(self, api_key: str) -> Optional[str]:
+        """Return the label of a matching active key, or None."""
+        if time.monotonic() >= self._next_check:
+            self._reload_if_changed()
+        # Looked up by digest, not by the key itself, so lookup timing says
+        # nothing useful about a stored key
+        return self._keys.get(hashlib.sha256(api_key.encode()).digest())
+
+
+api_keys = APIKeyRegistry()
+
+
+async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
+    label = api_keys.verify(api_key)
+    if label is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
             headers={"WWW-Authenticate": "ApiKey"},
         )
-    return api_key
+    return label
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m app.auth <api-key>")
+    print(hash_api_key(sys.argv[1]))
@@ -0,0 +1,69 @@
+"""Helpers for the bulk endpoints.
+
+A ``POST /{entity}/bulk`` request is validated as a whole (FastAPI reports
+the failing item's index in the 422 ``loc``), then inserted in one
+transaction with a single executemany ``INSERT ... RETURNING``. Endpoints
+that take many ids at once share ``parse_id_list`` and ``fetch_by_ids``.
+"""
+
+from typing import List, Sequence, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .cache import invalidate_dashboards
+
+MAX_BULK_ITEMS = 1000
+IDS_DESCRIPTION = (
+    "Comma-separated IDs to fetch in one request (other filters still apply); "
+    "IDs with no matching row are listed in missing_ids"
+)
+
+
+def raise_item_errors(errors: List[dict]) -> None:
+    """Reject the whole batch with per-item errors shaped like FastAPI's 422s."""
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+
+
+def item_error(index: int, field: str, msg: str) -> dict:
+    return {"loc": ["body", index, field], "msg": msg, "type": "value_error"}
+
+
+def parse_id_list(ids: str) -> List[int]:
+    """Parse a comma-separated ``ids`` query parameter (400 if malformed or too long)."""
+    try:
+        parsed = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    if len(parsed) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} ids per request")
+    return parsed
+
+
+def fetch_by_ids(query, id_column, ids: List[int]) -> dict:
+    """Fetch the rows with ``ids`` in one IN query, as a page in request order plus ``missing_ids``."""
+    rows = {row.id: row for row in query.filter(id_column.in_(ids))}
+    return {
+        "items": [rows[i] for i in ids if i in rows],
+        "next_cursor": None,
+        "missing_ids": [i for i in ids if i not in rows],
+    }
+
+
+def bulk_insert(db: Session, model, payloads: Sequence[BaseModel], response_model: Type[BaseModel]) -> list:
+    """Insert all payloads in one statement and return them as response models."""
+    created = db.scalars(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        [p.model_dump() for p in payloads],
+    ).all()
+    # Serialise before commit: committing expires the instances, and reading
+    # them afterwards would issue one SELECT per row.
+    items = [response_model.model_validate(obj) for obj in created]
+    db.commit()
+    invalidate_dashboards()
+    return items
@@ -0,0 +1,63 @@
+"""Small in-process TTL caches for read-mostly aggregate endpoints.
+
+Each worker process keeps its own copy, so entries are kept short-lived and
+are dropped eagerly (``invalidate_dashboards``) by the write paths of the
+routers whose data they summarise.
+"""
+
+import os
+import time
+from typing import Any, Hashable, List, Optional
+
+from .metrics import CACHE_LOOKUPS
+
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "10"))
+
+
+class TTLCache:
+    """Dict-backed cache whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict = {}
+        self._hit_counter = CACHE_LOOKUPS.labels(cache=name, result="hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(cache=name, result="miss")
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            self._hit_counter.inc()
+            return entry[1]
+        self.misses += 1
+        self._miss_counter.inc()
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries = {}
+
+
+_dashboard_caches: List[TTLCache] = []
+
+
+def register_dashboard_cache(name: str) -> TTLCache:
+    """Create a TTL cache that is cleared by ``invalidate_dashboards``."""
+    cache = TTLCache(name, DASHBOARD_CACHE_TTL)
+    _dashboard_caches.append(cache)
+    return cache
+
+
+dashboard_cache = register_dashboard_cache("dashboard")
+
+
+def invalidate_dashboards() -> None:
+    """Drop every cached dashboard aggregate; call after any committed write."""
+    for cache in _dashboard_caches:
+        cache.clear()
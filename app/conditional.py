@@ -0,0 +1,138 @@
+"""Conditional requests (ETags and Last-Modified) driven by ``updated_at``.
+
+Validators are computed from ``(id, updated_at)`` pairs only, so a request
+carrying ``If-None-Match`` / ``If-Modified-Since`` can be answered with a
+probe query over those two columns and a bodiless 304, without loading or
+serialising the full rows. For a list page the pairs of every row on the
+page, plus whether a next page exists, make up a weak validator. A single
+row's ETag is strong and encodes its ``updated_at`` directly, so an
+``If-Match`` on a write (which only accepts strong tags) can be turned back
+into a ``WHERE updated_at = ...`` condition. Sparse (``fields=``)
+representations add their ``FieldSet.variant`` to the tag, so they never
+share a validator with the full representation or with each other.
+"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+Validators = Tuple[str, Optional[datetime]]
+
+IF_MATCH_DESCRIPTION = "ETag from an earlier read; the write is refused with 412 if the row has changed since"
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they are stored as UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def compute_validators(
+    pairs: Iterable[Tuple[int, datetime]], has_more: bool = False, variant: str = ""
+) -> Validators:
+    """Weak ETag and Last-Modified for a single row or a page of ``(id, updated_at)`` pairs."""
+    digest = hashlib.sha1(variant.encode())
+    last_modified = None
+    for row_id, updated_at in pairs:
+        digest.update(f"{row_id}:{updated_at.isoformat()};".encode())
+        updated_at = _utc(updated_at)
+        if last_modified is None or updated_at > last_modified:
+            last_modified = updated_at
+    digest.update(b"+" if has_more else b".")
+    return f'W/"{digest.hexdigest()[:20]}"', last_modified
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def row_validators(updated_at: datetime, variant: str = "") -> Validators:
+    """Strong ETag and Last-Modified for one row.
+
+    The ETag is ``updated_at`` in epoch microseconds, followed by
+    ``-<variant>`` for a sparse representation.
+    """
+    updated_at = _utc(updated_at)
+    version = (updated_at - _EPOCH) // _MICROSECOND
+    return (f'"{version}-{variant}"' if variant else f'"{version}"'), updated_at
+
+
+def parse_if_match(header: str) -> Optional[List[datetime]]:
+    """The ``updated_at`` versions an ``If-Match`` header accepts; None for ``*`` (any version).
+
+    If-Match uses the strong comparison (RFC 9110 section 13.1.1), so weak
+    tags and tags this API did not issue are dropped: they can never match.
+    A sparse representation's tag names the same version of the row as the
+    full one, so it is accepted too.
+    """
+    if header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        version = tag.strip('"').partition("-")[0]
+        if tag.startswith('"') and version.isdigit():
+            versions.append(_EPOCH + int(version) * _MICROSECOND)
+    return versions
+
+
+def page_validators(page: dict, variant: str = "") -> Validators:
+    """Validators for a ``fetch_page`` result whose items have ``id`` and ``updated_at``."""
+    return compute_validators(
+        ((item.id, item.updated_at) for item in page["items"]),
+        page["next_cursor"] is not None,
+        variant,
+    )
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def set_validators(response: Response, validators: Validators) -> None:
+    response.headers.update(_validator_headers(*validators))
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Weak comparison: the W/ prefix is ignored on both sides
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified(request: Request, validators: Validators) -> Optional[Response]:
+    """Return a 304 response if the request's preconditions say the client copy is current.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only consulted
+    when it is absent (RFC 9110 section 13.2.2).
+    """
+    etag, last_modified = validators
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        fresh = False
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                since = None
+            if since is not None:
+                # HTTP dates have one-second resolution
+                fresh = last_modified.replace(microsecond=0) <= _utc(since)
+    if fresh:
+        return Response(status_code=304, headers=_validator_headers(etag, last_modified))
+    return None
@@ -0,0 +1,260 @@
+"""Synthetic data at a chosen scale, for reproducing production-sized behaviour locally.
+
+``generate(db, scale)`` inserts, per unit of scale, 1,000 contracts (with
+about 3.5 clauses each), 200 compliance items, 50 legal contacts and
+about 1,700 notes. Values follow rough real-world shapes rather than
+uniform noise:
+
+- most contracts are active or expired, and a few are drafts;
+- contract values are log-normal per type;
+- a minority of contracts carry most of the clauses;
+- high-risk clauses are rare;
+- due dates cluster around today.
+
+Rows go in with multi-row ``INSERT ... RETURNING id`` statements, in
+batches, within one transaction. The same ``seed`` gives the same data.
+"""
+
+import math
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .models import (
+    Clause,
+    ClauseType,
+    ComplianceCategory,
+    ComplianceItem,
+    ComplianceStatus,
+    ContactRole,
+    Contract,
+    ContractStatus,
+    ContractType,
+    LegalContact,
+    LegalNote,
+    ReferenceType,
+    RiskLevel,
+)
+
+CONTRACTS_PER_SCALE = 1000
+COMPLIANCE_ITEMS_PER_SCALE = 200
+CONTACTS_PER_SCALE = 50
+GENERAL_NOTES_PER_SCALE = 100
+BATCH_SIZE = 2000
+HISTORY_DAYS = 5 * 365
+
+CONTRACT_STATUSES = {
+    ContractStatus.active: 45,
+    ContractStatus.expired: 20,
+    ContractStatus.draft: 15,
+    ContractStatus.review: 10,
+    ContractStatus.terminated: 10,
+}
+# type: (weight, median value, log-normal sigma)
+CONTRACT_TYPES = {
+    ContractType.vendor: (30, 50_000, 1.0),
+    ContractType.service_agreement: (25, 120_000, 1.1),
+    ContractType.nda: (20, 0, 0),
+    ContractType.employment: (12, 90_000, 0.4),
+    ContractType.lease: (8, 250_000, 0.8),
+    ContractType.other: (5, 20_000, 1.2),
+}
+CURRENCIES = {"USD": 70, "EUR": 15, "GBP": 10, "CAD": 5}
+CLAUSE_TYPES = {
+    ClauseType.confidentiality: 20,
+    ClauseType.termination: 20,
+    ClauseType.payment: 18,
+    ClauseType.liability: 15,
+    ClauseType.ip: 12,
+    ClauseType.non_compete: 5,
+    ClauseType.other: 10,
+}
+RISK_LEVELS = {RiskLevel.low: 60, RiskLevel.medium: 30, RiskLevel.high: 10}
+COMPLIANCE_STATUSES = {
+    ComplianceStatus.compliant: 55,
+    ComplianceStatus.pending: 25,
+    ComplianceStatus.expiring: 12,
+    ComplianceStatus.non_compliant: 8,
+}
+CONTACT_ROLES = {ContactRole.attorney: 45, ContactRole.paralegal: 30, ContactRole.advisor: 15, ContactRole.notary: 10}
+
+COMPANY_WORDS = (
+    "Acme", "Northwind", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay",
+    "Tyrell", "Soylent", "Cyberdyne", "Wonka", "Aperture", "Gringotts", "Oscorp", "Pied Piper",
+)
+COMPANY_SUFFIXES = ("Inc.", "Ltd.", "LLC", "GmbH", "plc", "Corp.", "Holdings")
+SUBJECTS = (
+    "Cloud Hosting", "Software Licence", "Office Lease", "Consulting Services", "Data Processing",
+    "Marketing Services", "Hardware Supply", "Support and Maintenance", "Recruitment", "Logistics",
+)
+FIRST_NAMES = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn")
+LAST_NAMES = ("Smith", "Garcia", "Chen", "Okafor", "Müller", "Rossi", "Nakamura", "Singh", "Dubois", "Novak")
+SENTENCES = (
+    "Either party may terminate this agreement on ninety days' written notice.",
+    "Liability is capped at the fees paid in the twelve months preceding the claim.",
+    "All intellectual property created under this agreement vests in the client.",
+    "Confidential information must not be disclosed to third parties without consent.",
+    "Invoices are payable within thirty days of receipt.",
+    "The supplier shall maintain insurance cover appropriate to the services.",
+    "This agreement is governed by the laws of the State of New York.",
+    "Renewal terms are subject to a price review at each anniversary.",
+)
+COMPLIANCE_TITLES = (
+    "GDPR data processing register", "SOC 2 Type II audit", "ISO 27001 surveillance audit",
+    "Business licence renewal", "Anti-bribery policy attestation", "Export control screening",
+    "PCI DSS self-assessment", "Insurance certificate renewal", "Whistleblowing policy review",
+)
+
+
+def _weighted(rng: random.Random, weights: Dict) -> Any:
+    return rng.choices(list(weights), weights=[w[0] if isinstance(w, tuple) else w for w in weights.values()])[0]
+
+
+def _text(rng: random.Random, sentences: int) -> str:
+    return " ".join(rng.choice(SENTENCES) for _ in range(sentences))
+
+
+def _timestamp(day: date, rng: random.Random) -> datetime:
+    return datetime.combine(day, time(rng.randrange(8, 19), rng.randrange(60)), tzinfo=timezone.utc)
+
+
+def _insert(db: Session, model, rows: Sequence[dict], batch_size: int) -> List[int]:
+    """Insert rows in batches and return their ids, in order."""
+    table = model.__table__
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    ids: List[int] = []
+    for start in range(0, len(rows), batch_size):
+        ids.extend(db.scalars(stmt, rows[start:start + batch_size]).all())
+    return ids
+
+
+def _contract(rng: random.Random, today: date) -> dict:
+    contract_type = _weighted(rng, CONTRACT_TYPES)
+    _, median, sigma = CONTRACT_TYPES[contract_type]
+    status = _weighted(rng, CONTRACT_STATUSES)
+    created = today - timedelta(days=rng.randrange(HISTORY_DAYS))
+    start = created + timedelta(days=rng.randrange(60))
+    end = start + timedelta(days=365 * rng.choice((1, 1, 2, 3)))
+    if status == ContractStatus.expired:
+        # Expired contracts ended in the past
+        end = min(end, today - timedelta(days=rng.randrange(1, 365)))
+        start = min(start, end - timedelta(days=365))
+    company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    created_at = _timestamp(created, rng)
+    return {
+        "title": f"{rng.choice(SUBJECTS)} {contract_type.value.replace('_', ' ').title()} — {company}",
+        "type": contract_type,
+        "status": status,
+        "counterparty": company,
+        "counterparty_email": f"legal@{company.split()[0].lower()}.example.com",
+        "start_date": None if status == ContractStatus.draft else start,
+        "end_date": None if status == ContractStatus.draft else end,
+        "renewal_date": end - timedelta(days=60) if status == ContractStatus.active else None,
+        "auto_renew": rng.random() < 0.3,
+        "value": round(rng.lognormvariate(math.log(median), sigma), 2) if median else None,
+        "currency": _weighted(rng, CURRENCIES),
+        "summary": _text(rng, rng.randrange(1, 6)),
+        "signed_date": start if status in (ContractStatus.active, ContractStatus.expired) else None,
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(days=rng.randrange(30)),
+    }
+
+
+def _clause_count(rng: random.Random) -> int:
+    # Heavy-tailed: most contracts have a few clauses, a few have dozens
+    return min(int(rng.paretovariate(1.6) * 2) - 1, 60)
+
+
+def _clause(rng: random.Random, contract_id: int) -> dict:
+    return {
+        "contract_id": contract_id,
+        "type": _weighted(rng, CLAUSE_TYPES),
+        "summary": rng.choice(SENTENCES)[:80],
+        "text": _text(rng, rng.randrange(2, 12)),
+        "risk_level": _weighted(rng, RISK_LEVELS),
+        "notes": _text(rng, 1) if rng.random() < 0.2 else None,
+    }
+
+
+def _compliance_item(rng: random.Random, today: date) -> dict:
+    created_at = _timestamp(today - timedelta(days=rng.randrange(HISTORY_DAYS)), rng)
+    return {
+        "title": rng.choice(COMPLIANCE_TITLES),
+        "description": _text(rng, rng.randrange(1, 4)),
+        "category": rng.choice(list(ComplianceCategory)),
+        "status": _weighted(rng, COMPLIANCE_STATUSES),
+        "due_date": today + timedelta(days=round(rng.gauss(30, 120))) if rng.random() < 0.9 else None,
+        "responsible_person": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "notes": _text(rng, 1) if rng.random() < 0.3 else None,
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(days=rng.randrange(90)),
+    }
+
+
+def _contact(rng: random.Random, index: int) -> dict:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    role = _weighted(rng, CONTACT_ROLES)
+    return {
+        "name": f"{first} {last}",
+        "role": role,
+        "firm": f"{rng.choice(LAST_NAMES)} & {rng.choice(LAST_NAMES)} LLP",
+        "email": f"{first.lower()}.{last.lower()}{index}@example.com",
+        "phone": f"+1-555-{rng.randrange(10_000):04d}",
+        "specialty": rng.choice(("Contract Law", "Employment Law", "IP", "Real Estate", "Privacy")),
+        "hourly_rate": round(rng.lognormvariate(math.log(300 if role == ContactRole.attorney else 90), 0.3), 2),
+        "notes": _text(rng, 1) if rng.random() < 0.5 else None,
+    }
+
+
+def _note(rng: random.Random, reference_type: ReferenceType, reference_id, today: date) -> dict:
+    return {
+        "reference_type": reference_type,
+        "reference_id": reference_id,
+        "content": _text(rng, rng.randrange(1, 5)),
+        "author": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "created_at": _timestamp(today - timedelta(days=rng.randrange(HISTORY_DAYS)), rng),
+    }
+
+
+def generate(db: Session, scale: int, seed: int = 0, batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """Insert ``scale`` units of synthetic data and commit; returns the rows inserted per table."""
+    rng = random.Random(seed)
+    today = date.today()
+
+    contracts = [_contract(rng, today) for _ in range(scale * CONTRACTS_PER_SCALE)]
+    contract_ids = _insert(db, Contract, contracts, batch_size)
+    clauses = [_clause(rng, contract_id) for contract_id in contract_ids for _ in range(_clause_count(rng))]
+    _insert(db, Clause, clauses, batch_size)
+    compliance_ids = _insert(
+        db,
+        ComplianceItem,
+        [_compliance_item(rng, today) for _ in range(scale * COMPLIANCE_ITEMS_PER_SCALE)],
+        batch_size,
+    )
+    contacts = [_contact(rng, i) for i in range(scale * CONTACTS_PER_SCALE)]
+    _insert(db, LegalContact, contacts, batch_size)
+
+    notes = [
+        _note(rng, ReferenceType.contract, contract_id, today)
+        for contract_id in contract_ids
+        for _ in range(rng.choice((0, 1, 1, 2, 2, 3)))
+    ]
+    notes += [
+        _note(rng, ReferenceType.compliance, compliance_id, today)
+        for compliance_id in compliance_ids
+        if rng.random() < 0.5
+    ]
+    notes += [_note(rng, ReferenceType.general, None, today) for _ in range(scale * GENERAL_NOTES_PER_SCALE)]
+    _insert(db, LegalNote, notes, batch_size)
+
+    db.commit()
+    return {
+        "contracts": len(contract_ids),
+        "clauses": len(clauses),
+        "compliance_items": len(compliance_ids),
+        "legal_contacts": len(contacts),
+        "legal_notes": len(notes),
+    }
@@ -0,0 +1,90 @@
+"""Sparse fieldsets (``fields=``) and fast serialisation for the list and get endpoints.
+
+Only the requested response fields are selected in SQL, as plain row tuples,
+so unrequested columns are never fetched and no ORM objects are hydrated.
+Rows are turned into dicts in response-schema field order and rendered with
+orjson, skipping the per-row Pydantic validation FastAPI would otherwise do
+for a ``response_model``; the output is the same JSON the schemas produce.
+List views leave out the unbounded ``Text`` columns (contract summaries,
+clause text, note content...) unless they are asked for by name.
+"""
+
+import hashlib
+from typing import Iterable, Optional, Set, Type
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Text
+from sqlalchemy.orm import load_only
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated response fields to return (id is always included). "
+    "List views omit large text fields unless they are named here."
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON rendered with orjson; UTC datetimes get a ``Z`` suffix, as Pydantic renders them."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def large_text_fields(model) -> Set[str]:
+    """Names of the model's unbounded ``Text`` columns."""
+    return {column.key for column in model.__table__.columns if isinstance(column.type, Text)}
+
+
+class FieldSet:
+    """The response fields selected for one request, and how to load and serialise them."""
+
+    def __init__(self, model, schema: Type[BaseModel], fields: Optional[str], list_view: bool):
+        self.model = model
+        if fields:
+            requested = {f.strip() for f in fields.split(",") if f.strip()}
+            unknown = sorted(requested.difference(schema.model_fields))
+            if unknown:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid fields {unknown}. Must be among: {list(schema.model_fields)}",
+                )
+            requested.add("id")
+        elif list_view:
+            requested = set(schema.model_fields) - large_text_fields(model)
+        else:
+            requested = set(schema.model_fields)
+        # Keep the schema's field order so trimmed payloads read like full ones
+        self.fields = tuple(f for f in schema.model_fields if f in requested)
+        # Every field requested: a whole entity (e.g. from Session.get) serialises as is
+        self.complete = len(self.fields) == len(schema.model_fields)
+        # Mixed into ETags, since each field selection is a different representation
+        self.variant = "" if self.complete else hashlib.sha1(",".join(self.fields).encode()).hexdigest()[:8]
+
+    def _columns(self, required) -> list:
+        columns = [getattr(self.model, f) for f in self.fields]
+        return columns + [c for c in required if c.key not in self.fields]
+
+    def apply(self, query, *required):
+        """Select the field columns as plain rows, followed by ``required`` ones (sort keys, validators)."""
+        return query.with_entities(*self._columns(required))
+
+    def load(self, query, *required):
+        """Like ``apply`` but loading ORM entities, for queries that also load relationships."""
+        return query.options(load_only(*self._columns(required)))
+
+    def dump(self, obj) -> dict:
+        """Serialise one row or entity."""
+        return {f: getattr(obj, f) for f in self.fields}
+
+    def dump_rows(self, rows: Iterable) -> list:
+        # Field columns come first in rows selected by ``apply``
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
+
+    def page_response(self, page: dict) -> FastJSONResponse:
+        return FastJSONResponse({**page, "items": self.dump_rows(page["items"])})
+
+    def response(self, obj) -> FastJSONResponse:
+        return FastJSONResponse(self.dump(obj))
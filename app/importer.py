@@ -0,0 +1,189 @@
+"""CSV import pipeline for contracts, clauses and compliance items.
+
+Rows are read as a stream and validated in batches against the ``*Create``
+schemas. On PostgreSQL (psycopg2) valid rows are written with ``COPY`` into
+a temporary staging table and merged into the target table with one
+``INSERT ... SELECT`` at the end, in the same transaction. Other databases
+fall back to one executemany ``INSERT`` per batch.
+
+Used by ``POST /api/v1/import/{entity}`` and the ``import_csv.py`` CLI.
+"""
+
+import csv
+import enum
+import io
+from collections import defaultdict
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from .cache import invalidate_dashboards
+from .models import Clause, ComplianceItem, Contract
+from .schemas import ClauseCreate, ComplianceItemCreate, ContractCreate, ImportReport, ImportRowError
+
+IMPORT_BATCH_SIZE = 5000
+# Rejected rows listed individually in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+IMPORTERS = {
+    "contracts": (Contract, ContractCreate),
+    "clauses": (Clause, ClauseCreate),
+    "compliance": (ComplianceItem, ComplianceItemCreate),
+}
+
+Batch = List[Tuple[int, BaseModel]]
+
+
+def _reject(report: ImportReport, line: int, errors: List[str]) -> None:
+    report.rejected += 1
+    if len(report.errors) < MAX_REPORTED_ERRORS:
+        report.errors.append(ImportRowError(line=line, errors=errors))
+
+
+def _format_errors(errors: list) -> List[str]:
+    return [f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in errors]
+
+
+def _validate_batch(schema, adapter: TypeAdapter, rows: List[Tuple[int, dict]], report: ImportReport) -> Batch:
+    """Validate a batch in one call; only a failing batch is split into per-row results."""
+    try:
+        return list(zip((line for line, _ in rows), adapter.validate_python([data for _, data in rows])))
+    except ValidationError as exc:
+        failed = defaultdict(list)
+        for error in exc.errors(include_url=False):
+            failed[error["loc"][0]].append({**error, "loc": error["loc"][1:]})
+    valid = []
+    for index, (line, data) in enumerate(rows):
+        if index in failed:
+            _reject(report, line, _format_errors(failed[index]))
+        else:
+            valid.append((line, schema.model_validate(data)))
+    return valid
+
+
+def _csv_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+class _InsertLoader:
+    """Portable loader: one executemany INSERT per batch."""
+
+    def __init__(self, db: Session, model, columns: List[str]):
+        self.db = db
+        self.model = model
+        self.columns = columns
+
+    def load(self, batch: Batch, report: ImportReport) -> None:
+        if self.model is Clause:
+            ids = {item.contract_id for _, item in batch}
+            existing = set(self.db.scalars(select(Contract.id).where(Contract.id.in_(ids))))
+            for line, item in batch:
+                if item.contract_id not in existing:
+                    _reject(report, line, [f"contract_id: Contract {item.contract_id} not found"])
+            batch = [(line, item) for line, item in batch if item.contract_id in existing]
+        if batch:
+            self.db.execute(insert(self.model), [item.model_dump() for _, item in batch])
+            report.imported += len(batch)
+
+    def finish(self, report: ImportReport) -> None:
+        pass
+
+
+class _CopyLoader:
+    """PostgreSQL loader: COPY each batch into a staging table, merge once at the end."""
+
+    def __init__(self, db: Session, model, columns: List[str]):
+        self.db = db
+        self.table = model.__table__.name
+        self.columns = columns
+        self.staging = f"import_{self.table}"
+        cols = ", ".join(columns)
+        db.execute(text(
+            f"CREATE TEMP TABLE {self.staging} ON COMMIT DROP AS "
+            f"SELECT {cols} FROM {self.table} WITH NO DATA"
+        ))
+        db.execute(text(f"ALTER TABLE {self.staging} ADD COLUMN _line integer"))
+        self.cursor = db.connection().connection.cursor()
+
+    def load(self, batch: Batch, report: ImportReport) -> None:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for line, item in batch:
+            data = item.model_dump()
+            writer.writerow([_csv_value(data[c]) for c in self.columns] + [line])
+        buf.seek(0)
+        self.cursor.copy_expert(
+            f"COPY {self.staging} ({', '.join(self.columns)}, _line) FROM STDIN WITH (FORMAT csv)", buf
+        )
+
+    def finish(self, report: ImportReport) -> None:
+        cols = ", ".join(f"s.{c}" for c in self.columns)
+        source = f"{self.staging} s"
+        if self.table == "clauses":
+            for line, contract_id in self.db.execute(text(
+                f"SELECT s._line, s.contract_id FROM {source} "
+                "WHERE NOT EXISTS (SELECT 1 FROM contracts c WHERE c.id = s.contract_id) ORDER BY s._line"
+            )):
+                _reject(report, line, [f"contract_id: Contract {contract_id} not found"])
+            source += " JOIN contracts c ON c.id = s.contract_id"
+        result = self.db.execute(text(
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) SELECT {cols} FROM {source} ORDER BY s._line"
+        ))
+        report.imported = result.rowcount
+        self.cursor.close()
+
+
+def _make_loader(db: Session, model, columns: List[str]):
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        return _CopyLoader(db, model, columns)
+    return _InsertLoader(db, model, columns)
+
+
+def import_csv(
+    db: Session,
+    entity: str,
+    lines: Iterable[str],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """Import CSV rows (with a header line) into ``entity`` in one transaction.
+
+    Columns not in the create schema are ignored and empty cells are treated
+    as missing, so schema defaults apply. ``progress`` is called after every
+    batch with the running report.
+    """
+    model, schema = IMPORTERS[entity]
+    columns = list(schema.model_fields)
+    adapter = TypeAdapter(List[schema])
+    report = ImportReport(entity=entity)
+    loader = _make_loader(db, model, columns)
+
+    def flush(rows):
+        loader.load(_validate_batch(schema, adapter, rows, report), report)
+        if progress:
+            progress(report)
+
+    try:
+        rows = []
+        # "line" is the CSV record number, counting the header as 1
+        for line, record in enumerate(csv.DictReader(lines), start=2):
+            report.processed += 1
+            rows.append((line, {k: v for k, v in record.items() if k in schema.model_fields and v not in ("", None)}))
+            if len(rows) >= batch_size:
+                flush(rows)
+                rows = []
+        if rows:
+            flush(rows)
+        loader.finish(report)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    invalidate_dashboards()
+    return report
@@ -0,0 +1,138 @@
+"""Per-request SQL instrumentation: query counts and timings, slow-query log, N+1 warnings.
+
+Cursor execution hooks on every engine add each statement to the
+``RequestStats`` of the request being served (a context variable set by
+``QueryStatsMiddleware``). That middleware reports the totals in a
+``Server-Timing`` response header, which browser dev tools show next to
+the request:
+
+    Server-Timing: db;dur=3.912;desc="4 queries", db-slowest;dur=1.804, app;dur=9.231
+
+Statements slower than ``DB_SLOW_QUERY_MS`` are logged wherever they run.
+With ``DB_N_PLUS_ONE_THRESHOLD`` set (meant for development), a warning is
+logged when one request runs the same statement more often than that,
+which usually means a relationship is lazy-loaded once per row.
+"""
+
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Statements taking longer than this (ms) are logged; 0 turns the log off
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+# Warn when a request runs one statement more than this many times; 0 (the default) turns it off
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "0"))
+
+
+class RequestStats:
+    """SQL statements run while serving one request."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        if DB_N_PLUS_ONE_THRESHOLD:
+            # Parameters are bound separately, so the text is the statement's shape
+            self.shapes[statement] += 1
+            if self.shapes[statement] == DB_N_PLUS_ONE_THRESHOLD + 1:
+                logger.warning(
+                    "Possible N+1: statement ran more than %d times in %s: %s",
+                    DB_N_PLUS_ONE_THRESHOLD,
+                    self.path,
+                    statement,
+                )
+
+    def server_timing(self) -> str:
+        metrics = [f'db;dur={self.db_seconds * 1000:.3f};desc="{self.queries} queries"']
+        if self.queries:
+            metrics.append(f"db-slowest;dur={self.slowest_seconds * 1000:.3f}")
+        metrics.append(f"app;dur={(time.perf_counter() - self.started) * 1000:.3f}")
+        return ", ".join(metrics)
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """The stats of the request being served, or None outside of a request."""
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, not the connection, so a statement that
+    # raises (and never reaches after_cursor_execute) leaves nothing behind.
+    # The rare internal statements run without a context are not timed.
+    if context is not None:
+        context.query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "query_started", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    if DB_SLOW_QUERY_MS and seconds * 1000 >= DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms)%s: %s",
+            seconds * 1000,
+            f" in {stats.path}" if stats is not None else "",
+            statement,
+        )
+
+
+def instrument_engine(engine) -> None:
+    """Attach the cursor execution hooks to a (sync) engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Collect ``RequestStats`` for each HTTP request and send them as ``Server-Timing``.
+
+    The header goes out with the response start, so statements a streaming
+    response runs while producing its body are not in it (they are still
+    logged if slow).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(f"{scope['method']} {scope['path']}")
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                header = (b"server-timing", stats.server_timing().encode())
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        token = _request_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
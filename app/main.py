@@ -1,31 +1,83 @@
+import hashlib
+import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.responses import HTMLResponse
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from prometheus_client import CONTENT_TYPE_LATEST
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sqlfunc
-
-from .database import SessionLocal, engine, get_db
+from sqlalchemy import func as sqlfunc, select
+
+from .database import (
+    DATABASE_ASYNC,
+    ReadYourWritesMiddleware,
+    SessionLocal,
+    async_engine,
+    async_pool_stats,
+    async_replica_engines,
+    engine,
+    get_db,
+    get_read_db,
+    pool_stats,
+    replicas,
+)
 from . import models
-from .models import Contract, Clause, ComplianceItem, LegalContact, LegalNote
-from .routers import clauses, compliance, contacts, contracts, dashboard, notes
+from .cache import register_dashboard_cache
+from .conditional import not_modified
+from .instrumentation import QueryStatsMiddleware
+from .metrics import MetricsMiddleware, instrument_pool, mark_process_dead, render_metrics
+from .migrations import ensure_schema
+from .models import Contract, ContractStatus, Clause, ComplianceItem, LegalContact, LegalNote
+from .schemas import PoolStatsResponse
+from .rollups import start_rollup_refresher
+from .routers import (
+    analytics,
+    clauses,
+    compliance,
+    contacts,
+    contracts,
+    dashboard,
+    export,
+    imports,
+    notes,
+    search,
+)
+
+# Apply pending migrations at boot; turn off where a release step runs them
+MIGRATE_ON_STARTUP = os.getenv("MIGRATE_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+# Insert the sample records into an empty database at boot
+SEED_ON_STARTUP = os.getenv("SEED_ON_STARTUP", "").lower() in ("1", "true", "yes")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Auto-create all tables on startup
-    models.Base.metadata.create_all(bind=engine)
+    # One schema-version query when the database is current; migrate only if it is behind
+    ensure_schema(engine, migrate=MIGRATE_ON_STARTUP)
+
+    # Sample data is opt-in (or run `python seed.py`)
+    if SEED_ON_STARTUP:
+        db = SessionLocal()
+        try:
+            from .seed import seed_db
+            seed_db(db)
+        finally:
+            db.close()
 
-    # Seed sample data if the database is empty
-    db = SessionLocal()
-    try:
-        from .seed import seed_db
-        seed_db(db)
-    finally:
-        db.close()
+    rollup_refresher = start_rollup_refresher(engine)
 
     yield
 
+    if rollup_refresher is not None:
+        rollup_refresher.cancel()
+    for replica in replicas.engines:
+        replica.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+    mark_process_dead()
+
 
 app = FastAPI(
     title="Legal Pro API",
@@ -40,6 +92,19 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+if replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+instrument_pool(engine, "primary")
+for index, replica in enumerate(replicas.engines):
+    instrument_pool(replica, f"replica{index}")
+if async_engine is not None:
+    instrument_pool(async_engine.sync_engine, "async_primary")
+for index, replica in enumerate(async_replica_engines):
+    instrument_pool(replica.sync_engine, f"async_replica{index}")
+
 from viv_auth import init_auth
 User, require_auth = init_auth(app, engine, models.Base, get_db, app_name="Legal Pro")
 
@@ -48,74 +113,67 @@ User, require_auth = init_auth(app, engine, models.Base, get_db, app_name="Legal
 # Root dashboard — no auth required
 # ---------------------------------------------------------------------------
 
-@app.get("/", response_class=HTMLResponse, include_in_schema=False)
-def root_dashboard(db: Session = Depends(get_db), user=Depends(require_auth)):
-    contract_count = db.query(sqlfunc.count(Contract.id)).scalar() or 0
-    active = db.query(sqlfunc.count(Contract.id)).filter(Contract.status == "active").scalar() or 0
-    draft = db.query(sqlfunc.count(Contract.id)).filter(Contract.status == "draft").scalar() or 0
-    expired = db.query(sqlfunc.count(Contract.id)).filter(Contract.status == "expired").scalar() or 0
-    clause_count = db.query(sqlfunc.count(Clause.id)).scalar() or 0
-    compliance_count = db.query(sqlfunc.count(ComplianceItem.id)).scalar() or 0
-    contact_count = db.query(sqlfunc.count(LegalContact.id)).scalar() or 0
-    note_count = db.query(sqlfunc.count(LegalNote.id)).scalar() or 0
-    recent = db.query(Contract).order_by(Contract.created_at.desc()).limit(8).all()
-    status_colors = {"draft": "#f5a623", "review": "#4f8ef7", "active": "#34c759", "expired": "#e74c3c", "terminated": "#7f8c9b"}
-    rows = ""
+ROOT_CACHE_MAX_AGE = 5
+STATUS_COLORS = {"draft": "#f5a623", "review": "#4f8ef7", "active": "#34c759", "expired": "#e74c3c", "terminated": "#7f8c9b"}
+
+templates = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=select_autoescape(["html"]),
+)
+dashboard_template = templates.get_template("dashboard.html")
+root_page_cache = register_dashboard_cache("root_dashboard")
+
+
+def _render_root_dashboard(db: Session) -> str:
+    # All card counts in one statement: conditional aggregates over contracts
+    # plus one scalar subquery per other table.
+    counts = db.execute(
+        select(
+            sqlfunc.count().label("contracts"),
+            sqlfunc.count().filter(Contract.status == ContractStatus.active).label("active"),
+            sqlfunc.count().filter(Contract.status == ContractStatus.draft).label("draft"),
+            sqlfunc.count().filter(Contract.status == ContractStatus.expired).label("expired"),
+            select(sqlfunc.count()).select_from(Clause).scalar_subquery().label("clauses"),
+            select(sqlfunc.count()).select_from(ComplianceItem).scalar_subquery().label("compliance"),
+            select(sqlfunc.count()).select_from(LegalContact).scalar_subquery().label("contacts"),
+            select(sqlfunc.count()).select_from(LegalNote).scalar_subquery().label("notes"),
+        ).select_from(Contract)
+    ).one()
+    recent = db.execute(
+        select(Contract.title, Contract.counterparty, Contract.status, Contract.value, Contract.end_date)
+        .order_by(Contract.created_at.desc(), Contract.id.desc())
+        .limit(8)
+    ).all()
+    rows = []
     for c in recent:
-        sc = status_colors.get(c.status.value if hasattr(c.status, 'value') else str(c.status), "#7f8c9b")
-        st = c.status.value if hasattr(c.status, 'value') else str(c.status)
-        val = f"${c.value:,.2f}" if c.value else "—"
-        end = str(c.end_date) if c.end_date else "—"
-        rows += f'<tr><td>{c.title}</td><td>{c.counterparty}</td><td><span style="color:{sc};font-weight:600">{st}</span></td><td>{val}</td><td>{end}</td></tr>'
-    return f"""<!DOCTYPE html>
-<html lang="en"><head><meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0"><title>Legal Pro</title>
-<style>
-:root{{--primary:#4f8ef7;--success:#34c759;--warning:#f5a623;--danger:#e74c3c;--bg:#1a1f36;--bg-light:#f5f7fa;--card:#fff;--text:#2c3e50;--muted:#7f8c9b;--border:#e1e5eb}}
-*{{box-sizing:border-box;margin:0;padding:0}}
-body{{font-family:system-ui,-apple-system,sans-serif;background:var(--bg-light);color:var(--text);display:flex;min-height:100vh}}
-.sidebar{{width:240px;background:var(--bg);color:#fff;display:flex;flex-direction:column;flex-shrink:0}}
-.logo{{padding:1.5rem;font-size:1.4rem;font-weight:700}}
-.nav-links{{flex:1;padding:0 1rem}}
-.nav-link{{display:block;padding:.75rem 1rem;color:#cbd5e1;text-decoration:none;border-radius:6px;margin-bottom:.25rem}}
-.nav-link:hover,.nav-link.active{{background:rgba(255,255,255,.15);color:#fff}}
-.main{{flex:1;padding:2rem;overflow-y:auto}}
-h1{{font-size:1.8rem;margin-bottom:1.5rem}}
-.cards{{display:grid;grid-template-columns:repeat(auto-fit,minmax(180px,1fr));gap:1rem;margin-bottom:2rem}}
-.card{{background:var(--card);border-radius:10px;padding:1.5rem;border:1px solid var(--border)}}
-.card .label{{font-size:.85rem;color:var(--muted);margin-bottom:.25rem}}
-.card .value{{font-size:1.6rem;font-weight:700}}
-.card .value.blue{{color:var(--primary)}} .card .value.green{{color:var(--success)}} .card .value.orange{{color:var(--warning)}} .card .value.red{{color:var(--danger)}}
-table{{width:100%;border-collapse:collapse;background:var(--card);border-radius:10px;overflow:hidden;border:1px solid var(--border)}}
-th,td{{padding:.75rem 1rem;text-align:left;border-bottom:1px solid var(--border)}}
-th{{background:var(--bg);color:#fff;font-weight:600;font-size:.85rem;text-transform:uppercase;letter-spacing:.5px}}
-tr:last-child td{{border-bottom:none}}
-.section-title{{font-size:1.1rem;font-weight:600;margin-bottom:1rem}}
-a.api-link{{display:inline-block;margin-top:1rem;padding:.5rem 1rem;background:var(--primary);color:#fff;border-radius:6px;text-decoration:none;font-size:.9rem}}
-</style></head><body>
-<div class="sidebar">
-  <div class="logo">Legal Pro</div>
-  <div class="nav-links">
-    <a href="/" class="nav-link active">Dashboard</a>
-    <a href="/docs" class="nav-link">API Docs</a>
-    <a href="/auth/logout" class="nav-link" style="border-top:1px solid rgba(255,255,255,.1);padding-top:.75rem;margin-top:.5rem;color:#f87171">Logout</a>
-  </div>
-</div>
-<div class="main">
-  <h1>Dashboard</h1>
-  <div class="cards">
-    <div class="card"><div class="label">Contracts</div><div class="value blue">{contract_count}</div></div>
-    <div class="card"><div class="label">Active</div><div class="value green">{active}</div></div>
-    <div class="card"><div class="label">Draft</div><div class="value orange">{draft}</div></div>
-    <div class="card"><div class="label">Expired</div><div class="value red">{expired}</div></div>
-    <div class="card"><div class="label">Clauses</div><div class="value">{clause_count}</div></div>
-    <div class="card"><div class="label">Compliance</div><div class="value">{compliance_count}</div></div>
-    <div class="card"><div class="label">Contacts</div><div class="value">{contact_count}</div></div>
-    <div class="card"><div class="label">Notes</div><div class="value">{note_count}</div></div>
-  </div>
-  <div class="section-title">Recent Contracts</div>
-  <table><thead><tr><th>Title</th><th>Counterparty</th><th>Status</th><th>Value</th><th>End Date</th></tr></thead><tbody>{rows if rows else '<tr><td colspan="5" style="text-align:center;color:var(--muted)">No contracts yet</td></tr>'}</tbody></table>
-  <a href="/docs" class="api-link">API Documentation &rarr;</a>
-</div></body></html>"""
+        st = c.status.value if hasattr(c.status, "value") else str(c.status)
+        rows.append({
+            "title": c.title,
+            "counterparty": c.counterparty,
+            "status": st,
+            "color": STATUS_COLORS.get(st, "#7f8c9b"),
+            "value": f"${c.value:,.2f}" if c.value else "—",
+            "end_date": str(c.end_date) if c.end_date else "—",
+        })
+    return dashboard_template.render(counts=counts, recent=rows)
+
+
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+def root_dashboard(request: Request, db: Session = Depends(get_read_db), user=Depends(require_auth)):
+    # Read sessions (replica ones too) connect on their first query, so a
+    # cache hit never touches the database.
+    page = root_page_cache.get("page")
+    if page is None:
+        html = _render_root_dashboard(db)
+        page = (html, '"%s"' % hashlib.sha1(html.encode()).hexdigest())
+        root_page_cache.set("page", page)
+    html, etag = page
+    cache_control = f"private, max-age={ROOT_CACHE_MAX_AGE}"
+    cached = not_modified(request, (etag, None))
+    if cached:
+        cached.headers["Cache-Control"] = cache_control
+        return cached
+    return HTMLResponse(html, headers={"ETag": etag, "Cache-Control": cache_control})
 
 
 # ---------------------------------------------------------------------------
@@ -127,6 +185,25 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/health/pool", tags=["Health"], response_model=PoolStatsResponse)
+def health_pool():
+    """Connection pool occupancy and checkout wait times for this worker process.
+
+    Under ``DATABASE_ASYNC`` the async pool serving the read endpoints is
+    reported under ``async_reads``.
+    """
+    stats = pool_stats.snapshot(engine.pool)
+    if async_engine is not None:
+        stats["async_reads"] = async_pool_stats.snapshot(async_engine.pool)
+    return stats
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics, summed over all worker processes in multiprocess mode."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # ---------------------------------------------------------------------------
 # API v1 routers
 # ---------------------------------------------------------------------------
@@ -136,4 +213,12 @@ app.include_router(clauses.router,   prefix="/api/v1", tags=["Clauses"])
 app.include_router(compliance.router, prefix="/api/v1", tags=["Compliance"])
 app.include_router(contacts.router,  prefix="/api/v1", tags=["Legal Contacts"])
 app.include_router(notes.router,     prefix="/api/v1", tags=["Legal Notes"])
-app.include_router(dashboard.router, prefix="/api/v1", tags=["Dashboard"])
+app.include_router(
+    dashboard.async_router if DATABASE_ASYNC else dashboard.router,
+    prefix="/api/v1",
+    tags=["Dashboard"],
+)
+app.include_router(export.router,    prefix="/api/v1", tags=["Export"])
+app.include_router(search.router,    prefix="/api/v1", tags=["Search"])
+app.include_router(imports.router,   prefix="/api/v1", tags=["Import"])
+app.include_router(analytics.router, prefix="/api/v1", tags=["Analytics"])
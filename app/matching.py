@@ -0,0 +1,52 @@
+"""Substring and fuzzy (trigram similarity) text filters for list endpoints.
+
+``substring`` mode is a case-insensitive ``ILIKE '%term%'``, which PostgreSQL
+serves from the pg_trgm GIN indexes. ``fuzzy`` mode filters with the pg_trgm
+``%`` operator (similarity above ``pg_trgm.similarity_threshold``) and ranks
+by ``similarity()``; it needs pg_trgm and otherwise degrades to substring.
+"""
+
+from typing import List
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+MATCH_PATTERN = "^(substring|fuzzy)$"
+
+_trigram_support: dict = {}
+
+
+def _has_trigram(db: Session) -> bool:
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    key = bind.url
+    if key not in _trigram_support:
+        row = db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first()
+        _trigram_support[key] = row is not None
+    return _trigram_support[key]
+
+
+class TextMatcher:
+    """Applies text filters in one mode and remembers how to rank fuzzy results."""
+
+    def __init__(self, db: Session, mode: str):
+        self.fuzzy = mode == "fuzzy" and _has_trigram(db)
+        self._scores: List = []
+
+    def apply(self, query, column, value: str):
+        if self.fuzzy:
+            self._scores.append(func.similarity(column, value))
+            return query.filter(column.op("%")(value))
+        return query.filter(column.ilike(f"%{value}%"))
+
+    @property
+    def ranked(self) -> bool:
+        """True when results should be ordered by similarity instead of the keyset order."""
+        return bool(self._scores)
+
+    def ranked_page(self, query, limit: int, id_column) -> dict:
+        """Best ``limit`` matches by similarity; fuzzy results are a single page."""
+        score = sum(self._scores[1:], self._scores[0])
+        rows = query.order_by(score.desc(), id_column.asc()).limit(limit).all()
+        return {"items": rows, "next_cursor": None}
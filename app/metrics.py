@@ -0,0 +1,160 @@
+"""Prometheus metrics: per-route HTTP latency and size, in-flight requests, pool and cache usage.
+
+When uvicorn or gunicorn run several worker processes, set
+``PROMETHEUS_MULTIPROC_DIR`` to an empty directory shared by the workers
+(and cleared before they start). Every worker then writes its samples to
+memory-mapped files there, and ``/metrics`` serves the sum over all of
+them, whichever worker answers the scrape. Without it, each process
+reports only its own samples.
+
+Routes are labelled by their template (``/api/v1/contracts/{contract_id}``),
+never the raw path, so the number of series stays bounded. The labelled
+children are cached by ``MetricsMiddleware``, so an observation does not
+go through the ``labels()`` lookup and its lock.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+KNOWN_METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ["method", "route"],
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size.",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "Responses with a 4xx or 5xx status; unhandled exceptions count as 500.",
+    ["method", "route", "status"],
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_progress",
+    "Requests being served.",
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Connections the pool keeps open (pool_size).",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "In-process TTL cache lookups.",
+    ["cache", "result"],
+)
+
+
+def instrument_pool(engine, name: str) -> None:
+    """Track the engine's checked-out connections under ``pool=name``."""
+    checked_out = POOL_CHECKED_OUT.labels(pool=name)
+    size = getattr(engine.pool, "size", None)
+    if callable(size):
+        POOL_SIZE.labels(pool=name).set(size())
+    event.listen(engine, "checkout", lambda *args: checked_out.inc())
+    event.listen(engine, "checkin", lambda *args: checked_out.dec())
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    # The matched route may belong to an included router and so lack its
+    # prefix; recover the prefix from the part of the path the route did not match
+    try:
+        matched = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    path = scope["path"]
+    if path.endswith(matched):
+        return path[: len(path) - len(matched)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """Record latency, response size and errors per route template, and requests in flight."""
+
+    def __init__(self, app):
+        self.app = app
+        self._children: dict = {}
+
+    def _observers(self, method: str, route: str):
+        key = (method, route)
+        children = self._children.get(key)
+        if children is None:
+            children = (REQUEST_LATENCY.labels(method, route), RESPONSE_SIZE.labels(method, route))
+            self._children[key] = children
+        return children
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            IN_FLIGHT.dec()
+            method = scope["method"] if scope["method"] in KNOWN_METHODS else "other"
+            route = _route_template(scope)
+            latency, response_size = self._observers(method, route)
+            latency.observe(time.perf_counter() - started)
+            response_size.observe(size)
+            if status >= 400:
+                REQUEST_ERRORS.labels(method, route, str(status)).inc()
+
+
+def render_metrics() -> bytes:
+    """The exposition text for a scrape; across all workers in multiprocess mode."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared directory; call when it shuts down."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,149 @@
+"""Versioned schema migrations.
+
+Each migration is a module exposing ``VERSION``, ``NAME`` and ``upgrade(conn)``.
+Applied versions are recorded in ``schema_migrations``; ``apply_migrations``
+runs the pending ones in order, each in its own transaction, under a
+PostgreSQL advisory lock so that workers booting together migrate one at a
+time. Migrations must be idempotent DDL (``IF NOT EXISTS``) so that they are
+also safe on databases whose tables were created by ``create_all``. An
+optional migration whose prerequisites are missing raises
+``MigrationSkipped``: it is not recorded, so the next run retries it.
+
+At boot ``ensure_schema`` reads the recorded version with a single query and
+only goes through the migrations when the database is behind. Run them
+ahead of a deploy with ``python -m app.migrations``.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select, text
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Connection, Engine
+
+
+# Defined before the migration modules are imported, since they raise it
+class MigrationSkipped(Exception):
+    """Raised by an optional migration that cannot run on this server yet."""
+
+
+from . import (  # noqa: E402
+    v0000_baseline,
+    v0001_query_indexes,
+    v0002_full_text_search,
+    v0003_trigram_indexes,
+    v0004_rollup_tables,
+    v0005_auth_tables,
+)
+
+MIGRATIONS = [
+    v0000_baseline,
+    v0001_query_indexes,
+    v0002_full_text_search,
+    v0003_trigram_indexes,
+    v0004_rollup_tables,
+    v0005_auth_tables,
+]
+LATEST_VERSION = max(m.VERSION for m in MIGRATIONS)
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_lock key held while migrations run (any constant unique to this app)
+MIGRATION_LOCK_KEY = 7_403_221_901
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
+
+
+@contextmanager
+def _migration_lock(conn: Connection):
+    """Serialize migrations across workers on PostgreSQL with a session advisory lock.
+
+    Workers that boot together against a database that is behind wait here
+    for the first one to finish. SQLite, for local single-worker use, is
+    not locked.
+    """
+    if conn.dialect.name != "postgresql":
+        yield
+        return
+    conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    conn.commit()
+    try:
+        yield
+    finally:
+        conn.rollback()
+        conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        conn.commit()
+
+
+def apply_migrations(engine: Engine) -> list:
+    """Apply every pending migration and return the versions that were run.
+
+    The applied versions are read after taking the migration lock, so a
+    worker that waited for another one only runs what is still pending.
+    """
+    ran = []
+    with engine.connect() as conn, _migration_lock(conn):
+        with conn.begin():
+            metadata.create_all(conn)
+            applied = set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+        for migration in sorted(MIGRATIONS, key=lambda m: m.VERSION):
+            if migration.VERSION in applied:
+                continue
+            try:
+                with conn.begin():
+                    migration.upgrade(conn)
+                    conn.execute(insert(schema_migrations).values(version=migration.VERSION, name=migration.NAME))
+            except MigrationSkipped as exc:
+                logger.warning(
+                    "Skipped migration %s (%s), it will be retried: %s", migration.VERSION, migration.NAME, exc
+                )
+                continue
+            ran.append(migration.VERSION)
+    return ran
+
+
+def _schema_state(engine: Engine) -> Tuple[Optional[int], int]:
+    """The highest applied version (None if none is recorded) and how many versions are applied."""
+    with engine.connect() as conn:
+        try:
+            return tuple(conn.execute(select(func.max(schema_migrations.c.version), func.count())).one())
+        except (sa_exc.OperationalError, sa_exc.ProgrammingError):
+            # schema_migrations does not exist yet
+            return None, 0
+
+
+def schema_version(engine: Engine) -> Optional[int]:
+    """The highest applied migration version; None if no migration has been recorded."""
+    return _schema_state(engine)[0]
+
+
+def ensure_schema(engine: Engine, migrate: bool = True) -> list:
+    """Check the schema version at boot; apply pending migrations only if the database is behind.
+
+    Skipped optional migrations are retried too. With ``migrate=False`` an
+    outdated schema raises instead, for deployments that run migrations as
+    a separate release step.
+    """
+    version, applied = _schema_state(engine)
+    current = version is not None and version >= LATEST_VERSION
+    if current and applied == len(MIGRATIONS):
+        return []
+    if not migrate:
+        if current:
+            # Only skipped optional migrations are outstanding
+            return []
+        raise RuntimeError(
+            f"Database schema is at version {version}, this build needs {LATEST_VERSION}; "
+            "run `python -m app.migrations`"
+        )
+    return apply_migrations(engine)
@@ -0,0 +1,8 @@
+"""Apply pending schema migrations: ``python -m app.migrations``."""
+
+from ..database import engine
+from . import apply_migrations, schema_version
+
+if __name__ == "__main__":
+    ran = apply_migrations(engine)
+    print(f"Applied {ran or 'no'} migrations; schema is at version {schema_version(engine)}.")
@@ -0,0 +1,136 @@
+"""Baseline schema: the application tables, as ``create_all`` used to build them at boot.
+
+The table definitions are frozen here instead of read from ``app.models``,
+so this version always means the same schema; later model changes get
+their own migrations. Tables that already exist are left alone, so
+databases created before migrations owned the schema pick this version
+up as a no-op.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    func,
+)
+
+VERSION = 0
+NAME = "baseline"
+
+metadata = MetaData()
+
+Table(
+    "contracts",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("title", String(255), nullable=False),
+    Column(
+        "type",
+        Enum("nda", "service_agreement", "employment", "vendor", "lease", "other", name="contracttype"),
+        nullable=False,
+    ),
+    Column(
+        "status",
+        Enum("draft", "review", "active", "expired", "terminated", name="contractstatus"),
+        nullable=False,
+    ),
+    Column("counterparty", String(255), nullable=False),
+    Column("counterparty_email", String(255), nullable=True),
+    Column("start_date", Date, nullable=True),
+    Column("end_date", Date, nullable=True),
+    Column("renewal_date", Date, nullable=True),
+    Column("auto_renew", Boolean, nullable=False),
+    Column("value", Float, nullable=True),
+    Column("currency", String(10), nullable=False),
+    Column("summary", Text, nullable=True),
+    Column("file_url", String(512), nullable=True),
+    Column("signed_date", Date, nullable=True),
+    Column("created_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
+
+Table(
+    "clauses",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("contract_id", Integer, ForeignKey("contracts.id", ondelete="CASCADE"), nullable=False),
+    Column(
+        "type",
+        Enum(
+            "termination",
+            "liability",
+            "ip",
+            "confidentiality",
+            "non_compete",
+            "payment",
+            "other",
+            name="clausetype",
+        ),
+        nullable=False,
+    ),
+    Column("summary", String(512), nullable=True),
+    Column("text", Text, nullable=False),
+    Column("risk_level", Enum("low", "medium", "high", name="risklevel"), nullable=False),
+    Column("notes", Text, nullable=True),
+)
+
+Table(
+    "compliance_items",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("title", String(255), nullable=False),
+    Column("description", Text, nullable=True),
+    Column(
+        "category",
+        Enum("license", "regulation", "policy", "certification", name="compliancecategory"),
+        nullable=False,
+    ),
+    Column(
+        "status",
+        Enum("compliant", "non_compliant", "pending", "expiring", name="compliancestatus"),
+        nullable=False,
+    ),
+    Column("due_date", Date, nullable=True),
+    Column("responsible_person", String(255), nullable=True),
+    Column("notes", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
+
+Table(
+    "legal_contacts",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(255), nullable=False),
+    Column("role", Enum("attorney", "paralegal", "advisor", "notary", name="contactrole"), nullable=False),
+    Column("firm", String(255), nullable=True),
+    Column("email", String(255), nullable=True),
+    Column("phone", String(50), nullable=True),
+    Column("specialty", String(255), nullable=True),
+    Column("hourly_rate", Float, nullable=True),
+    Column("notes", Text, nullable=True),
+)
+
+Table(
+    "legal_notes",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("reference_type", Enum("contract", "compliance", "general", name="referencetype"), nullable=False),
+    Column("reference_id", Integer, nullable=True),
+    Column("content", Text, nullable=False),
+    Column("author", String(255), nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
+
+
+def upgrade(conn) -> None:
+    metadata.create_all(conn)
@@ -0,0 +1,30 @@
+"""Composite and partial indexes matching the list endpoints' filters and sort orders."""
+
+from sqlalchemy import text
+
+VERSION = 1
+NAME = "query_indexes"
+
+STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS ix_contracts_created_at_id ON contracts (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_contracts_status_created_at_id ON contracts (status, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_contracts_end_date ON contracts (end_date)",
+    "CREATE INDEX IF NOT EXISTS ix_contracts_status_end_date ON contracts (status, end_date)",
+    "CREATE INDEX IF NOT EXISTS ix_clauses_contract_id_id ON clauses (contract_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_clauses_risk_level_id ON clauses (risk_level, id)",
+    "CREATE INDEX IF NOT EXISTS ix_compliance_items_due_date_id ON compliance_items (due_date, id)",
+    "CREATE INDEX IF NOT EXISTS ix_compliance_items_status_due_date_id ON compliance_items (status, due_date, id)",
+    "CREATE INDEX IF NOT EXISTS ix_compliance_items_category_due_date_id ON compliance_items (category, due_date, id)",
+    "CREATE INDEX IF NOT EXISTS ix_compliance_items_open_due_date ON compliance_items (due_date) "
+    "WHERE status <> 'compliant'",
+    "CREATE INDEX IF NOT EXISTS ix_legal_contacts_name_id ON legal_contacts (name, id)",
+    "CREATE INDEX IF NOT EXISTS ix_legal_contacts_role_name_id ON legal_contacts (role, name, id)",
+    "CREATE INDEX IF NOT EXISTS ix_legal_notes_created_at_id ON legal_notes (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_legal_notes_reference_created_at_id "
+    "ON legal_notes (reference_type, reference_id, created_at, id)",
+]
+
+
+def upgrade(conn) -> None:
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
@@ -0,0 +1,62 @@
+"""Full-text search over contract summaries, clause text and note content.
+
+PostgreSQL: GIN indexes on the ``to_tsvector`` expressions the search router
+queries with, so they are maintained by the database on every write.
+
+SQLite (local runs): one FTS5 table fed by triggers. Its rowid is
+``id * 3 + kind`` so the triggers can update/delete entries by rowid.
+"""
+
+from sqlalchemy import text
+
+VERSION = 2
+NAME = "full_text_search"
+
+POSTGRES = [
+    "CREATE INDEX IF NOT EXISTS ix_contracts_summary_fts ON contracts "
+    "USING GIN (to_tsvector('english'::regconfig, summary))",
+    "CREATE INDEX IF NOT EXISTS ix_clauses_text_fts ON clauses "
+    "USING GIN (to_tsvector('english'::regconfig, text))",
+    "CREATE INDEX IF NOT EXISTS ix_legal_notes_content_fts ON legal_notes "
+    "USING GIN (to_tsvector('english'::regconfig, content))",
+]
+
+# (entity, kind, table, column)
+SQLITE_SOURCES = [
+    ("contract", 0, "contracts", "summary"),
+    ("clause", 1, "clauses", "text"),
+    ("note", 2, "legal_notes", "content"),
+]
+
+
+def _sqlite_statements() -> list:
+    statements = [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "entity UNINDEXED, ref_id UNINDEXED, body, tokenize = 'porter unicode61')",
+    ]
+    for entity, kind, table, column in SQLITE_SOURCES:
+        insert = (
+            f"INSERT INTO search_index (rowid, entity, ref_id, body) "
+            f"SELECT new.id * 3 + {kind}, '{entity}', new.id, new.{column} WHERE new.{column} IS NOT NULL;"
+        )
+        delete = f"DELETE FROM search_index WHERE rowid = old.id * 3 + {kind};"
+        statements += [
+            f"INSERT INTO search_index (rowid, entity, ref_id, body) "
+            f"SELECT id * 3 + {kind}, '{entity}', id, {column} FROM {table} WHERE {column} IS NOT NULL",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_au AFTER UPDATE ON {table} BEGIN "
+            f"{delete} {insert} END",
+        ]
+    return statements
+
+
+def upgrade(conn) -> None:
+    if conn.dialect.name == "postgresql":
+        statements = POSTGRES
+    elif conn.dialect.name == "sqlite":
+        statements = _sqlite_statements()
+    else:
+        return
+    for statement in statements:
+        conn.execute(text(statement))
@@ -0,0 +1,34 @@
+"""Trigram (pg_trgm) GIN indexes for substring and fuzzy matching.
+
+Serves ``ILIKE '%term%'`` and the ``%`` similarity operator on contact
+names/specialties, note authors and contract titles/counterparties. A no-op
+on other databases. On PostgreSQL servers without the pg_trgm extension it
+is skipped and left unrecorded, so it runs once the extension is installed
+(until then matching falls back to unindexed ILIKE).
+"""
+
+from sqlalchemy import text
+
+from . import MigrationSkipped
+
+VERSION = 3
+NAME = "trigram_indexes"
+
+STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_legal_contacts_name_trgm ON legal_contacts USING GIN (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_legal_contacts_specialty_trgm ON legal_contacts USING GIN (specialty gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_legal_notes_author_trgm ON legal_notes USING GIN (author gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_contracts_title_trgm ON contracts USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_contracts_counterparty_trgm ON contracts USING GIN (counterparty gin_trgm_ops)",
+]
+
+
+def upgrade(conn) -> None:
+    if conn.dialect.name != "postgresql":
+        return
+    available = conn.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).first()
+    if not available:
+        raise MigrationSkipped("pg_trgm is not available on this server; trigram indexes were not created")
+    for statement in STATEMENTS:
+        conn.execute(text(statement))
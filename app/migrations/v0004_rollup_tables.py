@@ -0,0 +1,67 @@
+"""Rollup tables for the analytics endpoints, and the row that tracks their refreshes.
+
+Frozen like the baseline; the enum types are the ones the baseline created.
+"""
+
+from sqlalchemy import Column, Date, DateTime, Enum, Float, Integer, MetaData, String, Table, insert, select
+
+VERSION = 4
+NAME = "rollup_tables"
+
+ROLLUP_NAME = "portfolio"
+
+metadata = MetaData()
+
+CONTRACT_TYPE = Enum("nda", "service_agreement", "employment", "vendor", "lease", "other", name="contracttype")
+CONTRACT_STATUS = Enum("draft", "review", "active", "expired", "terminated", name="contractstatus")
+CLAUSE_TYPE = Enum(
+    "termination", "liability", "ip", "confidentiality", "non_compete", "payment", "other", name="clausetype"
+)
+RISK_LEVEL = Enum("low", "medium", "high", name="risklevel")
+COMPLIANCE_CATEGORY = Enum("license", "regulation", "policy", "certification", name="compliancecategory")
+COMPLIANCE_STATUS = Enum("compliant", "non_compliant", "pending", "expiring", name="compliancestatus")
+
+Table(
+    "contract_value_rollup",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("type", CONTRACT_TYPE, nullable=False),
+    Column("status", CONTRACT_STATUS, nullable=False),
+    Column("currency", String(10), nullable=False),
+    Column("start_month", Date, nullable=True),
+    Column("contracts", Integer, nullable=False),
+    Column("total_value", Float, nullable=False),
+)
+
+Table(
+    "clause_risk_rollup",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("risk_level", RISK_LEVEL, nullable=False),
+    Column("type", CLAUSE_TYPE, nullable=False),
+    Column("clauses", Integer, nullable=False),
+)
+
+Table(
+    "compliance_rollup",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("category", COMPLIANCE_CATEGORY, nullable=False),
+    Column("status", COMPLIANCE_STATUS, nullable=False),
+    Column("due_month", Date, nullable=True),
+    Column("items", Integer, nullable=False),
+)
+
+refreshes = Table(
+    "rollup_refreshes",
+    metadata,
+    Column("name", String(50), primary_key=True),
+    Column("refreshed_at", DateTime(timezone=True), nullable=True),
+    Column("claimed_until", DateTime(timezone=True), nullable=True),
+)
+
+
+def upgrade(conn) -> None:
+    metadata.create_all(conn)
+    if conn.execute(select(refreshes.c.name).where(refreshes.c.name == ROLLUP_NAME)).first() is None:
+        conn.execute(insert(refreshes).values(name=ROLLUP_NAME))
@@ -0,0 +1,30 @@
+"""viv_auth's user tables, which ``create_all`` at boot used to create with the application tables.
+
+viv_auth declares its models on whatever declarative base ``init_auth`` is
+given. This migration hands it a private base and a throwaway app, so it
+reads viv_auth's table metadata without loading ``app.main``. Tables that
+already exist are left alone, so later changes to viv_auth's models need a
+migration of their own; ``scripts/check_fresh_schema.py`` reports columns
+they declare that the database lacks.
+"""
+
+from fastapi import FastAPI
+from sqlalchemy import MetaData
+from sqlalchemy.orm import declarative_base
+from viv_auth import init_auth
+
+from ..database import get_db
+
+VERSION = 5
+NAME = "auth_tables"
+
+
+def auth_metadata(engine) -> MetaData:
+    """The tables viv_auth declares, on their own ``MetaData``."""
+    base = declarative_base()
+    init_auth(FastAPI(), engine, base, get_db, app_name="Legal Pro")
+    return base.metadata
+
+
+def upgrade(conn) -> None:
+    auth_metadata(conn.engine).create_all(conn)
@@ -8,9 +8,11 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -88,6 +90,14 @@ class ReferenceType(str, enum.Enum):
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (
+        # list_contracts: ORDER BY created_at DESC, id DESC (optionally WHERE status = ...)
+        Index("ix_contracts_created_at_id", "created_at", "id"),
+        Index("ix_contracts_status_created_at_id", "status", "created_at", "id"),
+        # expiring_within range scans, with and without a status filter / dashboard
+        Index("ix_contracts_end_date", "end_date"),
+        Index("ix_contracts_status_end_date", "status", "end_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -112,11 +122,24 @@ class Contract(Base):
         nullable=False,
     )
 
-    clauses = relationship("Clause", back_populates="contract", cascade="all, delete-orphan")
+    # passive_deletes: deleting a contract leaves its clauses to the FK's ON DELETE CASCADE
+    # instead of loading and deleting them one by one
+    clauses = relationship(
+        "Clause",
+        back_populates="contract",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Clause.id",
+    )
 
 
 class Clause(Base):
     __tablename__ = "clauses"
+    __table_args__ = (
+        # FK lookups (cascades, /contracts/{id}/clauses) and list_clauses ORDER BY id
+        Index("ix_clauses_contract_id_id", "contract_id", "id"),
+        Index("ix_clauses_risk_level_id", "risk_level", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="CASCADE"), nullable=False)
@@ -131,6 +154,19 @@ class Clause(Base):
 
 class ComplianceItem(Base):
     __tablename__ = "compliance_items"
+    __table_args__ = (
+        # list_compliance_items: ORDER BY due_date ASC NULLS LAST, id
+        Index("ix_compliance_items_due_date_id", "due_date", "id"),
+        Index("ix_compliance_items_status_due_date_id", "status", "due_date", "id"),
+        Index("ix_compliance_items_category_due_date_id", "category", "due_date", "id"),
+        # Dashboard overdue count only ever looks at non-compliant items
+        Index(
+            "ix_compliance_items_open_due_date",
+            "due_date",
+            postgresql_where=text("status <> 'compliant'"),
+            sqlite_where=text("status <> 'compliant'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -151,6 +187,11 @@ class ComplianceItem(Base):
 
 class LegalContact(Base):
     __tablename__ = "legal_contacts"
+    __table_args__ = (
+        # list_contacts: ORDER BY name, id (optionally WHERE role = ...)
+        Index("ix_legal_contacts_name_id", "name", "id"),
+        Index("ix_legal_contacts_role_name_id", "role", "name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -165,6 +206,11 @@ class LegalContact(Base):
 
 class LegalNote(Base):
     __tablename__ = "legal_notes"
+    __table_args__ = (
+        # list_notes: ORDER BY created_at DESC, id DESC (optionally by reference)
+        Index("ix_legal_notes_created_at_id", "created_at", "id"),
+        Index("ix_legal_notes_reference_created_at_id", "reference_type", "reference_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     reference_type = Column(Enum(ReferenceType), nullable=False)
@@ -172,3 +218,51 @@ class LegalNote(Base):
     content = Column(Text, nullable=False)
     author = Column(String(255), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+# ---------------------------------------------------------------------------
+# Rollups (rebuilt by app.rollups; read by the analytics endpoints)
+# ---------------------------------------------------------------------------
+
+class ContractValueRollup(Base):
+    __tablename__ = "contract_value_rollup"
+
+    id = Column(Integer, primary_key=True)
+    type = Column(Enum(ContractType), nullable=False)
+    status = Column(Enum(ContractStatus), nullable=False)
+    currency = Column(String(10), nullable=False)
+    # First day of the start_date's month; NULL for contracts without a start date
+    start_month = Column(Date, nullable=True)
+    contracts = Column(Integer, nullable=False)
+    # Contracts without a value count as 0
+    total_value = Column(Float, nullable=False)
+
+
+class ClauseRiskRollup(Base):
+    __tablename__ = "clause_risk_rollup"
+
+    id = Column(Integer, primary_key=True)
+    risk_level = Column(Enum(RiskLevel), nullable=False)
+    type = Column(Enum(ClauseType), nullable=False)
+    clauses = Column(Integer, nullable=False)
+
+
+class ComplianceRollup(Base):
+    __tablename__ = "compliance_rollup"
+
+    id = Column(Integer, primary_key=True)
+    category = Column(Enum(ComplianceCategory), nullable=False)
+    status = Column(Enum(ComplianceStatus), nullable=False)
+    # First day of the due_date's month; NULL for items without a due date
+    due_month = Column(Date, nullable=True)
+    items = Column(Integer, nullable=False)
+
+
+class RollupRefresh(Base):
+    """When the rollups were last rebuilt, and which worker holds the rebuild."""
+
+    __tablename__ = "rollup_refreshes"
+
+    name = Column(String(50), primary_key=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=True)
+    claimed_until = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,74 @@
+"""Opaque keyset (cursor) pagination helpers shared by the list endpoints.
+
+A cursor encodes the sort-key values of the last row on a page. The next page
+is fetched with a ``WHERE (sort keys) > (cursor values)`` predicate instead of
+an OFFSET, so every page costs the same regardless of how deep the client is.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import String, literal
+from sqlalchemy.orm import Query, Session
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values into an opaque, URL-safe cursor string."""
+    payload = [v.isoformat() if hasattr(v, "isoformat") else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> List[Any]:
+    """Decode a cursor, converting each value with the matching parser.
+
+    A ``None`` value is passed through untouched (used for nullable sort keys).
+    Any malformed cursor is reported to the client as a 400.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor has the wrong shape")
+        return [None if v is None else parse(v) for parse, v in zip(parsers, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def cursor_timestamp(db: Session, value: datetime):
+    """A timestamp from a cursor, ready to compare with a timestamp column.
+
+    SQLite keeps timestamps as text and compares them as strings: rows
+    written by ``CURRENT_TIMESTAMP`` hold ``YYYY-MM-DD HH:MM:SS``, bound
+    parameters add ``.ffffff``. The cursor is bound as text in the format of
+    the row it came from (whole seconds mean ``CURRENT_TIMESTAMP``), so
+    ``<`` and ``=`` agree with the column's ORDER BY.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return value
+    fmt = "%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"
+    return literal(value.strftime(fmt), String)
+
+
+def fetch_page(
+    query: Query,
+    limit: int,
+    cursor_key: Callable[[Any], Sequence[Any]],
+) -> dict:
+    """Run an already-ordered query for one page and build the page payload.
+
+    One extra row is fetched to learn whether a next page exists without a
+    separate COUNT query.
+    """
+    rows = query.limit(limit + 1).all()
+    next_cursor: Optional[str] = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(cursor_key(rows[-1]))
+    return {"items": rows, "next_cursor": next_cursor}
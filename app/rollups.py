@@ -0,0 +1,146 @@
+"""Portfolio rollups: pre-aggregated contract, clause and compliance counts for ``/analytics``.
+
+The rollup tables hold one row per combination of the analytics dimensions
+(a few thousand rows, whatever the size of the base tables), so the
+analytics endpoints answer with a GROUP BY over them in milliseconds.
+
+They are rebuilt from the base tables by ``refresh_rollups``: in a single
+transaction, so readers see either the old or the new figures, never a
+mix. Every worker runs a background loop that checks, a few times per
+``ROLLUP_REFRESH_SECONDS``, whether a rebuild is due. A rebuild is claimed
+with a conditional UPDATE on ``rollup_refreshes``, so only one worker
+rebuilds per period.
+Figures can therefore lag writes by up to 1.2 periods plus a rebuild; the
+analytics routes document that bound and responses carry ``refreshed_at``.
+Rebuild on demand with ``python -m app.rollups``.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Date, cast, delete, func, insert, or_, select, update
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from .models import (
+    Clause,
+    ClauseRiskRollup,
+    ComplianceItem,
+    ComplianceRollup,
+    Contract,
+    ContractValueRollup,
+    RollupRefresh,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between rebuilds; 0 turns the background refresh off
+ROLLUP_REFRESH_SECONDS = float(os.getenv("ROLLUP_REFRESH_SECONDS", "300"))
+# A claimed rebuild that has not finished after this long may be taken over
+ROLLUP_CLAIM_SECONDS = 600
+ROLLUP_NAME = "portfolio"
+
+
+def _month(column, dialect: str):
+    if dialect == "sqlite":
+        return func.date(column, "start of month")
+    return cast(func.date_trunc("month", column), Date)
+
+
+def _rollup_queries(dialect: str) -> list:
+    """(rollup model, aggregate query over the base table) pairs, columns in matching order."""
+    start_month = _month(Contract.start_date, dialect)
+    due_month = _month(ComplianceItem.due_date, dialect)
+    return [
+        (
+            ContractValueRollup,
+            select(
+                Contract.type,
+                Contract.status,
+                Contract.currency,
+                start_month,
+                func.count(),
+                func.coalesce(func.sum(Contract.value), 0.0),
+            ).group_by(Contract.type, Contract.status, Contract.currency, start_month),
+        ),
+        (
+            ClauseRiskRollup,
+            select(Clause.risk_level, Clause.type, func.count()).group_by(Clause.risk_level, Clause.type),
+        ),
+        (
+            ComplianceRollup,
+            select(ComplianceItem.category, ComplianceItem.status, due_month, func.count()).group_by(
+                ComplianceItem.category, ComplianceItem.status, due_month
+            ),
+        ),
+    ]
+
+
+def _rollup_columns(model) -> list:
+    return [column for column in model.__table__.columns if column.key != "id"]
+
+
+def refresh_rollups(engine: Engine, force: bool = False) -> bool:
+    """Rebuild every rollup table if a refresh is due (always with ``force``).
+
+    Returns False without doing anything when the rollups are fresh or
+    another worker holds the claim.
+    """
+    refreshes = RollupRefresh.__table__
+    now = datetime.now(timezone.utc)
+    claim = (
+        update(refreshes)
+        .where(
+            refreshes.c.name == ROLLUP_NAME,
+            or_(refreshes.c.claimed_until.is_(None), refreshes.c.claimed_until < now),
+        )
+        .values(claimed_until=now + timedelta(seconds=ROLLUP_CLAIM_SECONDS))
+    )
+    if not force:
+        due = now - timedelta(seconds=ROLLUP_REFRESH_SECONDS)
+        claim = claim.where(or_(refreshes.c.refreshed_at.is_(None), refreshes.c.refreshed_at <= due))
+    with engine.begin() as conn:
+        if conn.execute(claim).rowcount != 1:
+            return False
+
+    release = update(refreshes).where(refreshes.c.name == ROLLUP_NAME)
+    try:
+        with engine.begin() as conn:
+            for model, query in _rollup_queries(conn.dialect.name):
+                conn.execute(delete(model.__table__))
+                conn.execute(insert(model.__table__).from_select(_rollup_columns(model), query))
+            conn.execute(release.values(refreshed_at=now, claimed_until=None))
+    except Exception:
+        with engine.begin() as conn:
+            conn.execute(release.values(claimed_until=None))
+        raise
+    return True
+
+
+async def _refresh_periodically(engine: Engine) -> None:
+    while True:
+        try:
+            await run_in_threadpool(refresh_rollups, engine)
+        except Exception:
+            logger.exception("Rollup refresh failed")
+        # Check more often than the period so a refresh is never a full period late
+        await asyncio.sleep(ROLLUP_REFRESH_SECONDS / 5)
+
+
+def start_rollup_refresher(engine: Engine) -> Optional[asyncio.Task]:
+    """Start this worker's background refresh loop; None when disabled."""
+    if ROLLUP_REFRESH_SECONDS <= 0:
+        return None
+    return asyncio.create_task(_refresh_periodically(engine))
+
+
+if __name__ == "__main__":
+    from .database import engine
+
+    if refresh_rollups(engine, force=True):
+        print("Rollups refreshed.")
+    else:
+        print("Another worker is refreshing the rollups.")
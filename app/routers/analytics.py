@@ -0,0 +1,185 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..auth import verify_api_key
+from ..database import get_read_db, read_endpoint
+from ..models import (
+    ClauseRiskRollup,
+    ClauseType,
+    ComplianceCategory,
+    ComplianceRollup,
+    ComplianceStatus,
+    ContractStatus,
+    ContractType,
+    ContractValueRollup,
+    RiskLevel,
+    RollupRefresh,
+)
+from ..rollups import ROLLUP_NAME, ROLLUP_REFRESH_SECONDS
+from ..schemas import ClauseRiskBucket, ComplianceBucket, ContractValueBucket, Rollup
+
+router = APIRouter()
+
+GROUP_BY_DESCRIPTION = "Comma-separated dimensions to group by, among: {}"
+
+# The refresh loop checks five times per period, so figures lag by at most 1.2 periods plus a rebuild
+if ROLLUP_REFRESH_SECONDS > 0:
+    STALENESS_NOTE = (
+        f"Figures come from rollup tables rebuilt every {ROLLUP_REFRESH_SECONDS:g} seconds, so they can "
+        f"lag writes by up to {ROLLUP_REFRESH_SECONDS * 1.2:g} seconds plus the time a rebuild takes. "
+        "`refreshed_at` is when the figures were computed."
+    )
+else:
+    STALENESS_NOTE = (
+        "Figures come from rollup tables that this deployment does not rebuild in the background "
+        "(ROLLUP_REFRESH_SECONDS=0): they are as of `refreshed_at`, and are rebuilt with "
+        "`python -m app.rollups`."
+    )
+
+CONTRACT_DIMENSIONS = {
+    "type": ContractValueRollup.type,
+    "status": ContractValueRollup.status,
+    "currency": ContractValueRollup.currency,
+    "start_month": ContractValueRollup.start_month,
+}
+CLAUSE_DIMENSIONS = {"risk_level": ClauseRiskRollup.risk_level, "type": ClauseRiskRollup.type}
+COMPLIANCE_DIMENSIONS = {
+    "category": ComplianceRollup.category,
+    "status": ComplianceRollup.status,
+    "due_month": ComplianceRollup.due_month,
+}
+
+
+def _parse_group_by(group_by: str, dimensions: Dict) -> List[str]:
+    selected = list(dict.fromkeys(d.strip() for d in group_by.split(",") if d.strip()))
+    unknown = [d for d in selected if d not in dimensions]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid group_by {unknown}. Must be among: {list(dimensions)}",
+        )
+    return selected
+
+
+def _parse_enum(value: str, enum_class, name: str):
+    try:
+        return enum_class(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {name} '{value}'. Must be one of: {[e.value for e in enum_class]}",
+        )
+
+
+def _rollup(db: Session, dimensions: Dict, group_by: List[str], measures: Dict, filters: list) -> dict:
+    """Re-aggregate a rollup table over the ``group_by`` dimensions."""
+    columns = [dimensions[d].label(d) for d in group_by]
+    keys = [dimensions[d] for d in group_by]
+    query = (
+        select(*columns, *(func.sum(m).label(name) for name, m in measures.items()))
+        .where(*filters)
+        .group_by(*keys)
+        .order_by(*keys)
+    )
+    return {
+        "refreshed_at": db.scalar(select(RollupRefresh.refreshed_at).where(RollupRefresh.name == ROLLUP_NAME)),
+        "items": [dict(row._mapping) for row in db.execute(query)],
+    }
+
+
+@router.get(
+    "/analytics/contracts/value",
+    response_model=Rollup[ContractValueBucket],
+    response_model_exclude_unset=True,
+)
+@read_endpoint
+def contract_value(
+    group_by: str = Query("type,status", description=GROUP_BY_DESCRIPTION.format(list(CONTRACT_DIMENSIONS))),
+    type: Optional[str] = Query(None, description="Only contracts of this type"),
+    status: Optional[str] = Query(None, description="Only contracts with this status"),
+    currency: Optional[str] = Query(None, description="Only contracts in this currency"),
+    start_from: Optional[date] = Query(None, description="Only contracts starting in or after this month"),
+    start_to: Optional[date] = Query(None, description="Only contracts starting in or before this month"),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    """Contract count and total value per group; always split by currency, so values are never mixed."""
+    dimensions = _parse_group_by(group_by, CONTRACT_DIMENSIONS)
+    if "currency" not in dimensions:
+        dimensions.append("currency")
+    filters = []
+    if type is not None:
+        filters.append(ContractValueRollup.type == _parse_enum(type, ContractType, "type"))
+    if status is not None:
+        filters.append(ContractValueRollup.status == _parse_enum(status, ContractStatus, "status"))
+    if currency is not None:
+        filters.append(ContractValueRollup.currency == currency)
+    if start_from is not None:
+        filters.append(ContractValueRollup.start_month >= start_from.replace(day=1))
+    if start_to is not None:
+        filters.append(ContractValueRollup.start_month <= start_to.replace(day=1))
+    measures = {"contracts": ContractValueRollup.contracts, "total_value": ContractValueRollup.total_value}
+    return _rollup(db, CONTRACT_DIMENSIONS, dimensions, measures, filters)
+
+
+@router.get(
+    "/analytics/clauses/risk",
+    response_model=Rollup[ClauseRiskBucket],
+    response_model_exclude_unset=True,
+)
+@read_endpoint
+def clause_risk(
+    group_by: str = Query("risk_level", description=GROUP_BY_DESCRIPTION.format(list(CLAUSE_DIMENSIONS))),
+    risk_level: Optional[str] = Query(None, description="Only clauses with this risk level"),
+    type: Optional[str] = Query(None, description="Only clauses of this type"),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    """Clause counts per risk level and/or clause type."""
+    filters = []
+    if risk_level is not None:
+        filters.append(ClauseRiskRollup.risk_level == _parse_enum(risk_level, RiskLevel, "risk_level"))
+    if type is not None:
+        filters.append(ClauseRiskRollup.type == _parse_enum(type, ClauseType, "type"))
+    measures = {"clauses": ClauseRiskRollup.clauses}
+    return _rollup(db, CLAUSE_DIMENSIONS, _parse_group_by(group_by, CLAUSE_DIMENSIONS), measures, filters)
+
+
+@router.get(
+    "/analytics/compliance",
+    response_model=Rollup[ComplianceBucket],
+    response_model_exclude_unset=True,
+)
+@read_endpoint
+def compliance(
+    group_by: str = Query(
+        "category,status", description=GROUP_BY_DESCRIPTION.format(list(COMPLIANCE_DIMENSIONS))
+    ),
+    category: Optional[str] = Query(None, description="Only items in this category"),
+    status: Optional[str] = Query(None, description="Only items with this status"),
+    due_from: Optional[date] = Query(None, description="Only items due in or after this month"),
+    due_to: Optional[date] = Query(None, description="Only items due in or before this month"),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    """Compliance item counts per category, status and/or due month."""
+    filters = []
+    if category is not None:
+        filters.append(ComplianceRollup.category == _parse_enum(category, ComplianceCategory, "category"))
+    if status is not None:
+        filters.append(ComplianceRollup.status == _parse_enum(status, ComplianceStatus, "status"))
+    if due_from is not None:
+        filters.append(ComplianceRollup.due_month >= due_from.replace(day=1))
+    if due_to is not None:
+        filters.append(ComplianceRollup.due_month <= due_to.replace(day=1))
+    measures = {"items": ComplianceRollup.items}
+    return _rollup(db, COMPLIANCE_DIMENSIONS, _parse_group_by(group_by, COMPLIANCE_DIMENSIONS), measures, filters)
+
+
+# Every analytics route documents how stale its figures can be
+for route in router.routes:
+    route.description = f"{route.description}\n\n{STALENESS_NOTE}"
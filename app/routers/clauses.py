@@ -1,36 +1,71 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..auth import verify_api_key
-from ..database import get_db
+from ..bulk import (
+    IDS_DESCRIPTION,
+    MAX_BULK_ITEMS,
+    bulk_insert,
+    fetch_by_ids,
+    item_error,
+    parse_id_list,
+    raise_item_errors,
+)
+from ..cache import invalidate_dashboards
+from ..database import get_db, get_read_db, read_endpoint
+from ..fields import FIELDS_DESCRIPTION, FieldSet
 from ..models import Clause, Contract
-from ..schemas import ClauseCreate, ClauseResponse, ClauseUpdate
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, fetch_page
+from ..schemas import ClauseCreate, ClauseResponse, ClauseUpdate, IdsPage, SparseClauseResponse
+from ..updates import patch_row
 
 router = APIRouter()
 
 
-def _get_or_404(db: Session, clause_id: int) -> Clause:
-    clause = db.query(Clause).filter(Clause.id == clause_id).first()
+def _get_or_404(db: Session, clause_id: int, fieldset: Optional[FieldSet] = None) -> Clause:
+    if fieldset is None or fieldset.complete:
+        clause = db.get(Clause, clause_id)
+    else:
+        clause = fieldset.apply(db.query(Clause)).filter(Clause.id == clause_id).first()
     if not clause:
         raise HTTPException(status_code=404, detail=f"Clause {clause_id} not found")
     return clause
 
 
-@router.get("/clauses", response_model=List[ClauseResponse])
+def apply_clause_filters(query, contract_id: Optional[int], risk_level: Optional[str]):
+    """Apply the list_clauses filters to a Query or Select (shared with exports)."""
+    if contract_id is not None:
+        query = query.filter(Clause.contract_id == contract_id)
+    if risk_level:
+        query = query.filter(Clause.risk_level == risk_level)
+    return query
+
+
+@router.get("/clauses", response_model=IdsPage[SparseClauseResponse])
+@read_endpoint
 def list_clauses(
     contract_id: Optional[int] = Query(None, description="Filter by contract ID"),
     risk_level: Optional[str] = Query(None, description="Filter by risk level"),
-    db: Session = Depends(get_db),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    query = db.query(Clause)
-    if contract_id is not None:
-        query = query.filter(Clause.contract_id == contract_id)
-    if risk_level:
-        query = query.filter(Clause.risk_level == risk_level)
-    return query.all()
+    fieldset = FieldSet(Clause, ClauseResponse, fields, list_view=True)
+    query = apply_clause_filters(db.query(Clause), contract_id, risk_level)
+    if ids is not None:
+        return fieldset.page_response(fetch_by_ids(fieldset.apply(query), Clause.id, parse_id_list(ids)))
+
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.filter(Clause.id > last_id)
+    query = fieldset.apply(query.order_by(Clause.id.asc()))
+    return fieldset.page_response(fetch_page(query, limit, lambda c: (c.id,)))
 
 
 @router.post("/clauses", response_model=ClauseResponse, status_code=status.HTTP_201_CREATED)
@@ -39,23 +74,43 @@ def create_clause(
     db: Session = Depends(get_db),
     _: str = Depends(verify_api_key),
 ):
-    contract = db.query(Contract).filter(Contract.id == payload.contract_id).first()
+    contract = db.get(Contract, payload.contract_id)
     if not contract:
         raise HTTPException(status_code=404, detail=f"Contract {payload.contract_id} not found")
     clause = Clause(**payload.model_dump())
     db.add(clause)
     db.commit()
+    invalidate_dashboards()
     db.refresh(clause)
     return clause
 
 
-@router.get("/clauses/{clause_id}", response_model=ClauseResponse)
+@router.post("/clauses/bulk", response_model=List[ClauseResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_clauses(
+    payload: List[ClauseCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    contract_ids = {item.contract_id for item in payload}
+    existing = set(db.scalars(select(Contract.id).where(Contract.id.in_(contract_ids))))
+    raise_item_errors([
+        item_error(index, "contract_id", f"Contract {item.contract_id} not found")
+        for index, item in enumerate(payload)
+        if item.contract_id not in existing
+    ])
+    return bulk_insert(db, Clause, payload, ClauseResponse)
+
+
+@router.get("/clauses/{clause_id}", response_model=SparseClauseResponse)
+@read_endpoint
 def get_clause(
     clause_id: int,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    return _get_or_404(db, clause_id)
+    fieldset = FieldSet(Clause, ClauseResponse, fields, list_view=False)
+    return fieldset.response(_get_or_404(db, clause_id, fieldset))
 
 
 @router.put("/clauses/{clause_id}", response_model=ClauseResponse)
@@ -68,16 +123,31 @@ def update_clause(
     clause = _get_or_404(db, clause_id)
     update_data = payload.model_dump(exclude_unset=True)
     if "contract_id" in update_data:
-        contract = db.query(Contract).filter(Contract.id == update_data["contract_id"]).first()
+        contract = db.get(Contract, update_data["contract_id"])
         if not contract:
             raise HTTPException(status_code=404, detail=f"Contract {update_data['contract_id']} not found")
     for field, value in update_data.items():
         setattr(clause, field, value)
     db.commit()
+    invalidate_dashboards()
     db.refresh(clause)
     return clause
 
 
+@router.patch("/clauses/{clause_id}", response_model=ClauseResponse)
+def patch_clause(
+    clause_id: int,
+    payload: ClauseUpdate,
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    values = payload.model_dump(exclude_unset=True)
+    if "contract_id" in values and db.get(Contract, values["contract_id"]) is None:
+        raise HTTPException(status_code=404, detail=f"Contract {values['contract_id']} not found")
+    row = patch_row(db, Clause, clause_id, values, f"Clause {clause_id} not found")
+    return FieldSet(Clause, ClauseResponse, None, list_view=False).response(row)
+
+
 @router.delete("/clauses/{clause_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_clause(
     clause_id: int,
@@ -87,3 +157,4 @@ def delete_clause(
     clause = _get_or_404(db, clause_id)
     db.delete(clause)
     db.commit()
+    invalidate_dashboards()
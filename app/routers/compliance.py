@@ -1,34 +1,55 @@
 from datetime import date, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, status
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 from ..auth import verify_api_key
-from ..database import get_db
+from ..bulk import IDS_DESCRIPTION, MAX_BULK_ITEMS, bulk_insert, fetch_by_ids, parse_id_list
+from ..cache import invalidate_dashboards
+from ..conditional import (
+    IF_MATCH_DESCRIPTION,
+    has_conditional_headers,
+    not_modified,
+    page_validators,
+    row_validators,
+    set_validators,
+)
+from ..database import get_db, get_read_db, read_endpoint
+from ..fields import FIELDS_DESCRIPTION, FieldSet
 from ..models import ComplianceItem, ComplianceStatus
-from ..schemas import ComplianceItemCreate, ComplianceItemResponse, ComplianceItemUpdate
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, fetch_page
+from ..schemas import (
+    ComplianceItemCreate,
+    ComplianceItemResponse,
+    ComplianceItemUpdate,
+    IdsPage,
+    SparseComplianceItemResponse,
+)
+from ..updates import patch_row
 
 router = APIRouter()
 
 
-def _get_or_404(db: Session, item_id: int) -> ComplianceItem:
-    item = db.query(ComplianceItem).filter(ComplianceItem.id == item_id).first()
+def _get_or_404(db: Session, item_id: int, fieldset: Optional[FieldSet] = None) -> ComplianceItem:
+    if fieldset is None or fieldset.complete:
+        item = db.get(ComplianceItem, item_id)
+    else:
+        query = fieldset.apply(db.query(ComplianceItem), ComplianceItem.updated_at)
+        item = query.filter(ComplianceItem.id == item_id).first()
     if not item:
         raise HTTPException(status_code=404, detail=f"Compliance item {item_id} not found")
     return item
 
 
-@router.get("/compliance", response_model=List[ComplianceItemResponse])
-def list_compliance_items(
-    status: Optional[str] = Query(None, description="Filter by compliance status"),
-    due_within: Optional[int] = Query(None, description="Filter items due within N days"),
-    category: Optional[str] = Query(None, description="Filter by category"),
-    db: Session = Depends(get_db),
-    _: str = Depends(verify_api_key),
+def apply_compliance_filters(
+    query,
+    status: Optional[str],
+    due_within: Optional[int],
+    category: Optional[str],
 ):
-    query = db.query(ComplianceItem)
-
+    """Apply the list_compliance_items filters to a Query or Select (shared with exports)."""
     if status:
         try:
             status_enum = ComplianceStatus(status)
@@ -51,7 +72,56 @@ def list_compliance_items(
     if category:
         query = query.filter(ComplianceItem.category == category)
 
-    return query.order_by(ComplianceItem.due_date.asc().nulls_last()).all()
+    return query
+
+
+@router.get("/compliance", response_model=IdsPage[SparseComplianceItemResponse])
+@read_endpoint
+def list_compliance_items(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by compliance status"),
+    due_within: Optional[int] = Query(None, description="Filter items due within N days"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    fieldset = FieldSet(ComplianceItem, ComplianceItemResponse, fields, list_view=True)
+    query = apply_compliance_filters(db.query(ComplianceItem), status, due_within, category)
+
+    if ids is not None:
+        return fieldset.page_response(fetch_by_ids(fieldset.apply(query), ComplianceItem.id, parse_id_list(ids)))
+
+    # Keyset on (due_date asc nulls last, id asc)
+    if cursor:
+        due_date, last_id = decode_cursor(cursor, date.fromisoformat, int)
+        if due_date is None:
+            query = query.filter(ComplianceItem.due_date.is_(None), ComplianceItem.id > last_id)
+        else:
+            query = query.filter(
+                or_(
+                    ComplianceItem.due_date > due_date,
+                    and_(ComplianceItem.due_date == due_date, ComplianceItem.id > last_id),
+                    ComplianceItem.due_date.is_(None),
+                )
+            )
+
+    query = query.order_by(ComplianceItem.due_date.asc().nulls_last(), ComplianceItem.id.asc())
+    if has_conditional_headers(request):
+        # Same page, but only the validator columns
+        probe_query = query.with_entities(ComplianceItem.id, ComplianceItem.updated_at)
+        probe = fetch_page(probe_query, limit, lambda r: (r.id,))
+        cached = not_modified(request, page_validators(probe, fieldset.variant))
+        if cached:
+            return cached
+    query = fieldset.apply(query, ComplianceItem.due_date, ComplianceItem.updated_at)
+    page = fetch_page(query, limit, lambda i: (i.due_date, i.id))
+    response = fieldset.page_response(page)
+    set_validators(response, page_validators(page, fieldset.variant))
+    return response
 
 
 @router.post("/compliance", response_model=ComplianceItemResponse, status_code=status.HTTP_201_CREATED)
@@ -63,17 +133,40 @@ def create_compliance_item(
     item = ComplianceItem(**payload.model_dump())
     db.add(item)
     db.commit()
+    invalidate_dashboards()
     db.refresh(item)
     return item
 
 
-@router.get("/compliance/{item_id}", response_model=ComplianceItemResponse)
+@router.post("/compliance/bulk", response_model=List[ComplianceItemResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_compliance_items(
+    payload: List[ComplianceItemCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    return bulk_insert(db, ComplianceItem, payload, ComplianceItemResponse)
+
+
+@router.get("/compliance/{item_id}", response_model=SparseComplianceItemResponse)
+@read_endpoint
 def get_compliance_item(
     item_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    return _get_or_404(db, item_id)
+    fieldset = FieldSet(ComplianceItem, ComplianceItemResponse, fields, list_view=False)
+    if has_conditional_headers(request):
+        updated_at = db.scalar(select(ComplianceItem.updated_at).where(ComplianceItem.id == item_id))
+        if updated_at is not None:
+            cached = not_modified(request, row_validators(updated_at, fieldset.variant))
+            if cached:
+                return cached
+    item = _get_or_404(db, item_id, fieldset)
+    response = fieldset.response(item)
+    set_validators(response, row_validators(item.updated_at, fieldset.variant))
+    return response
 
 
 @router.put("/compliance/{item_id}", response_model=ComplianceItemResponse)
@@ -87,10 +180,26 @@ def update_compliance_item(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(item, field, value)
     db.commit()
+    invalidate_dashboards()
     db.refresh(item)
     return item
 
 
+@router.patch("/compliance/{item_id}", response_model=ComplianceItemResponse)
+def patch_compliance_item(
+    item_id: int,
+    payload: ComplianceItemUpdate,
+    if_match: Optional[str] = Header(None, description=IF_MATCH_DESCRIPTION),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    values = payload.model_dump(exclude_unset=True)
+    row = patch_row(db, ComplianceItem, item_id, values, f"Compliance item {item_id} not found", if_match)
+    response = FieldSet(ComplianceItem, ComplianceItemResponse, None, list_view=False).response(row)
+    set_validators(response, row_validators(row.updated_at))
+    return response
+
+
 @router.delete("/compliance/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_compliance_item(
     item_id: int,
@@ -100,3 +209,4 @@ def delete_compliance_item(
     item = _get_or_404(db, item_id)
     db.delete(item)
     db.commit()
+    invalidate_dashboards()
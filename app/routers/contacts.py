@@ -1,36 +1,76 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ..auth import verify_api_key
-from ..database import get_db
+from ..bulk import IDS_DESCRIPTION, MAX_BULK_ITEMS, bulk_insert, fetch_by_ids, parse_id_list
+from ..cache import invalidate_dashboards
+from ..database import get_db, get_read_db, read_endpoint
+from ..fields import FIELDS_DESCRIPTION, FieldSet
+from ..matching import MATCH_PATTERN, TextMatcher
 from ..models import LegalContact
-from ..schemas import LegalContactCreate, LegalContactResponse, LegalContactUpdate
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, fetch_page
+from ..schemas import IdsPage, LegalContactCreate, LegalContactResponse, LegalContactUpdate, SparseLegalContactResponse
+from ..updates import patch_row
 
 router = APIRouter()
 
 
-def _get_or_404(db: Session, contact_id: int) -> LegalContact:
-    contact = db.query(LegalContact).filter(LegalContact.id == contact_id).first()
+def _get_or_404(db: Session, contact_id: int, fieldset: Optional[FieldSet] = None) -> LegalContact:
+    if fieldset is None or fieldset.complete:
+        contact = db.get(LegalContact, contact_id)
+    else:
+        contact = fieldset.apply(db.query(LegalContact)).filter(LegalContact.id == contact_id).first()
     if not contact:
         raise HTTPException(status_code=404, detail=f"Legal contact {contact_id} not found")
     return contact
 
 
-@router.get("/contacts", response_model=List[LegalContactResponse])
+@router.get("/contacts", response_model=IdsPage[SparseLegalContactResponse])
+@read_endpoint
 def list_contacts(
     role: Optional[str] = Query(None, description="Filter by contact role"),
-    specialty: Optional[str] = Query(None, description="Filter by specialty (partial match)"),
-    db: Session = Depends(get_db),
+    name: Optional[str] = Query(None, description="Filter by name (partial or fuzzy match)"),
+    specialty: Optional[str] = Query(None, description="Filter by specialty (partial or fuzzy match)"),
+    match: str = Query(
+        "substring", pattern=MATCH_PATTERN, description="Text filter mode: substring or fuzzy (ranked by similarity)"
+    ),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
+    fieldset = FieldSet(LegalContact, LegalContactResponse, fields, list_view=True)
     query = db.query(LegalContact)
     if role:
         query = query.filter(LegalContact.role == role)
+    matcher = TextMatcher(db, match)
+    if name:
+        query = matcher.apply(query, LegalContact.name, name)
     if specialty:
-        query = query.filter(LegalContact.specialty.ilike(f"%{specialty}%"))
-    return query.order_by(LegalContact.name.asc()).all()
+        query = matcher.apply(query, LegalContact.specialty, specialty)
+    if ids is not None:
+        return fieldset.page_response(fetch_by_ids(fieldset.apply(query), LegalContact.id, parse_id_list(ids)))
+    if matcher.ranked:
+        return fieldset.page_response(matcher.ranked_page(fieldset.apply(query), limit, LegalContact.id))
+
+    # Keyset on (name asc, id asc)
+    if cursor:
+        last_name, last_id = decode_cursor(cursor, str, int)
+        query = query.filter(
+            or_(
+                LegalContact.name > last_name,
+                and_(LegalContact.name == last_name, LegalContact.id > last_id),
+            )
+        )
+
+    query = query.order_by(LegalContact.name.asc(), LegalContact.id.asc())
+    query = fieldset.apply(query, LegalContact.name)
+    return fieldset.page_response(fetch_page(query, limit, lambda c: (c.name, c.id)))
 
 
 @router.post("/contacts", response_model=LegalContactResponse, status_code=status.HTTP_201_CREATED)
@@ -42,17 +82,30 @@ def create_contact(
     contact = LegalContact(**payload.model_dump())
     db.add(contact)
     db.commit()
+    invalidate_dashboards()
     db.refresh(contact)
     return contact
 
 
-@router.get("/contacts/{contact_id}", response_model=LegalContactResponse)
+@router.post("/contacts/bulk", response_model=List[LegalContactResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_contacts(
+    payload: List[LegalContactCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    return bulk_insert(db, LegalContact, payload, LegalContactResponse)
+
+
+@router.get("/contacts/{contact_id}", response_model=SparseLegalContactResponse)
+@read_endpoint
 def get_contact(
     contact_id: int,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    return _get_or_404(db, contact_id)
+    fieldset = FieldSet(LegalContact, LegalContactResponse, fields, list_view=False)
+    return fieldset.response(_get_or_404(db, contact_id, fieldset))
 
 
 @router.put("/contacts/{contact_id}", response_model=LegalContactResponse)
@@ -66,10 +119,23 @@ def update_contact(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(contact, field, value)
     db.commit()
+    invalidate_dashboards()
     db.refresh(contact)
     return contact
 
 
+@router.patch("/contacts/{contact_id}", response_model=LegalContactResponse)
+def patch_contact(
+    contact_id: int,
+    payload: LegalContactUpdate,
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    values = payload.model_dump(exclude_unset=True)
+    row = patch_row(db, LegalContact, contact_id, values, f"Legal contact {contact_id} not found")
+    return FieldSet(LegalContact, LegalContactResponse, None, list_view=False).response(row)
+
+
 @router.delete("/contacts/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_contact(
     contact_id: int,
@@ -79,3 +145,4 @@ def delete_contact(
     contact = _get_or_404(db, contact_id)
     db.delete(contact)
     db.commit()
+    invalidate_dashboards()
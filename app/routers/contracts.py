@@ -1,38 +1,148 @@
-from datetime import date, timedelta
-from typing import List, Optional
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Sequence, Set
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, status
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 from ..auth import verify_api_key
-from ..database import get_db
-from ..models import Clause, Contract, ContractStatus
+from ..bulk import IDS_DESCRIPTION, MAX_BULK_ITEMS, bulk_insert, fetch_by_ids, parse_id_list
+from ..cache import invalidate_dashboards
+from ..conditional import (
+    IF_MATCH_DESCRIPTION,
+    has_conditional_headers,
+    not_modified,
+    page_validators,
+    row_validators,
+    set_validators,
+)
+from ..database import get_db, get_read_db, read_endpoint
+from ..fields import FIELDS_DESCRIPTION, FastJSONResponse, FieldSet
+from ..matching import MATCH_PATTERN, TextMatcher
+from ..models import Clause, Contract, ContractStatus, LegalNote, ReferenceType
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_timestamp, decode_cursor, fetch_page
 from ..schemas import (
+    BulkDeleteResult,
     ClauseResponse,
     ContractCreate,
     ContractResponse,
     ContractUpdate,
+    LegalNoteResponse,
+    IdsPage,
+    Page,
+    SparseClauseResponse,
+    SparseContractDetailResponse,
 )
+from ..updates import patch_row
 
 router = APIRouter()
 
 
-def _get_or_404(db: Session, contract_id: int) -> Contract:
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
+def _get_or_404(
+    db: Session,
+    contract_id: int,
+    fieldset: Optional[FieldSet] = None,
+    includes: Set[str] = frozenset(),
+) -> Contract:
+    if fieldset is None or fieldset.complete:
+        contract = db.get(Contract, contract_id, options=_include_options(includes))
+    else:
+        query = _select(db.query(Contract), fieldset, includes, Contract.updated_at)
+        contract = query.filter(Contract.id == contract_id).first()
     if not contract:
         raise HTTPException(status_code=404, detail=f"Contract {contract_id} not found")
     return contract
 
 
-@router.get("/contracts", response_model=List[ContractResponse])
-def list_contracts(
-    status: Optional[str] = Query(None, description="Filter by contract status"),
-    expiring_within: Optional[int] = Query(None, description="Filter contracts expiring within N days"),
-    db: Session = Depends(get_db),
-    _: str = Depends(verify_api_key),
-):
-    query = db.query(Contract)
+INCLUDES = ("clauses", "notes")
+INCLUDE_DESCRIPTION = "Comma-separated related rows to embed: clauses, notes"
+
+
+def _parse_includes(include: Optional[str]) -> Set[str]:
+    if not include:
+        return set()
+    selected = {i.strip() for i in include.split(",") if i.strip()}
+    unknown = sorted(selected.difference(INCLUDES))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid include {unknown}. Must be among: {list(INCLUDES)}",
+        )
+    return selected
+
+
+def _include_options(includes: Set[str]) -> list:
+    if "clauses" in includes:
+        # One extra SELECT ... WHERE contract_id IN (...) for the whole page
+        return [selectinload(Contract.clauses)]
+    return []
+
+
+def _load_includes(query, includes: Set[str]):
+    return query.options(*_include_options(includes))
+
 
+def _select(query, fieldset: FieldSet, includes: Set[str], *required):
+    """Project the requested fields; relationships can only be loaded onto entities, not rows."""
+    if includes:
+        return fieldset.load(_load_includes(query, includes), *required)
+    return fieldset.apply(query, *required)
+
+
+def _with_includes(db: Session, contracts: Sequence[Contract], includes: Set[str], fieldset: FieldSet) -> List[dict]:
+    """Serialise contracts with their requested related rows, which must already be loaded.
+
+    Payloads are built explicitly so an un-requested ``clauses`` is never
+    lazy-loaded and stays out of the response.
+    """
+    if not includes:
+        return fieldset.dump_rows(contracts)
+
+    notes = defaultdict(list)
+    if "notes" in includes and contracts:
+        for note in db.scalars(
+            select(LegalNote)
+            .where(
+                LegalNote.reference_type == ReferenceType.contract,
+                LegalNote.reference_id.in_([c.id for c in contracts]),
+            )
+            .order_by(LegalNote.created_at.desc(), LegalNote.id.desc())
+        ):
+            notes[note.reference_id].append(LegalNoteResponse.model_validate(note).model_dump(mode="json"))
+
+    items = []
+    for contract in contracts:
+        item = fieldset.dump(contract)
+        if "clauses" in includes:
+            item["clauses"] = [ClauseResponse.model_validate(c).model_dump(mode="json") for c in contract.clauses]
+        if "notes" in includes:
+            item["notes"] = notes[contract.id]
+        items.append(item)
+    return items
+
+
+def _delete_contracts(db: Session, stmt) -> int:
+    """Run a ``delete(Contract)`` statement and commit; returns how many contracts were deleted.
+
+    Clauses go with them through the FK's ON DELETE CASCADE. Notes only
+    reference contracts loosely (reference_type/reference_id), so the ones
+    left pointing at deleted contracts are removed in the same transaction.
+    """
+    deleted = db.scalars(stmt.returning(Contract.id).execution_options(synchronize_session=False)).all()
+    if deleted:
+        db.execute(
+            delete(LegalNote)
+            .where(LegalNote.reference_type == ReferenceType.contract, LegalNote.reference_id.in_(deleted))
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    invalidate_dashboards()
+    return len(deleted)
+
+
+def apply_contract_filters(query, status: Optional[str], expiring_within: Optional[int]):
+    """Apply the list_contracts filters to a Query or Select (shared with exports)."""
     if status:
         try:
             status_enum = ContractStatus(status)
@@ -52,7 +162,73 @@ def list_contracts(
             Contract.end_date <= deadline,
         )
 
-    return query.order_by(Contract.created_at.desc()).all()
+    return query
+
+
+@router.get("/contracts", response_model=IdsPage[SparseContractDetailResponse])
+@read_endpoint
+def list_contracts(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by contract status"),
+    expiring_within: Optional[int] = Query(None, description="Filter contracts expiring within N days"),
+    title: Optional[str] = Query(None, description="Filter by title (partial or fuzzy match)"),
+    counterparty: Optional[str] = Query(None, description="Filter by counterparty (partial or fuzzy match)"),
+    match: str = Query(
+        "substring", pattern=MATCH_PATTERN, description="Text filter mode: substring or fuzzy (ranked by similarity)"
+    ),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    includes = _parse_includes(include)
+    fieldset = FieldSet(Contract, ContractResponse, fields, list_view=True)
+    query = apply_contract_filters(db.query(Contract), status, expiring_within)
+    matcher = TextMatcher(db, match)
+    if title:
+        query = matcher.apply(query, Contract.title, title)
+    if counterparty:
+        query = matcher.apply(query, Contract.counterparty, counterparty)
+    if ids is not None:
+        page = fetch_by_ids(_select(query, fieldset, includes), Contract.id, parse_id_list(ids))
+        return FastJSONResponse({**page, "items": _with_includes(db, page["items"], includes, fieldset)})
+    if matcher.ranked:
+        query = _select(query, fieldset, includes)
+        page = matcher.ranked_page(query, limit, Contract.id)
+        return FastJSONResponse({"items": _with_includes(db, page["items"], includes, fieldset), "next_cursor": None})
+
+    # Keyset on (created_at desc, id desc)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        created_at = cursor_timestamp(db, created_at)
+        query = query.filter(
+            or_(
+                Contract.created_at < created_at,
+                and_(Contract.created_at == created_at, Contract.id < last_id),
+            )
+        )
+
+    query = query.order_by(Contract.created_at.desc(), Contract.id.desc())
+    # Validators only track the contract rows, so embedded pages are never conditional
+    conditional = not includes
+    if conditional and has_conditional_headers(request):
+        # Same page, but only the validator columns
+        probe_query = query.with_entities(Contract.id, Contract.updated_at)
+        probe = fetch_page(probe_query, limit, lambda r: (r.id,))
+        cached = not_modified(request, page_validators(probe, fieldset.variant))
+        if cached:
+            return cached
+    query = _select(query, fieldset, includes, Contract.created_at, Contract.updated_at)
+    page = fetch_page(query, limit, lambda c: (c.created_at, c.id))
+    response = FastJSONResponse(
+        {"items": _with_includes(db, page["items"], includes, fieldset), "next_cursor": page["next_cursor"]}
+    )
+    if conditional:
+        set_validators(response, page_validators(page, fieldset.variant))
+    return response
 
 
 @router.post("/contracts", response_model=ContractResponse, status_code=status.HTTP_201_CREATED)
@@ -64,17 +240,62 @@ def create_contract(
     contract = Contract(**payload.model_dump())
     db.add(contract)
     db.commit()
+    invalidate_dashboards()
     db.refresh(contract)
     return contract
 
 
-@router.get("/contracts/{contract_id}", response_model=ContractResponse)
+@router.post("/contracts/bulk", response_model=List[ContractResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_contracts(
+    payload: List[ContractCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    return bulk_insert(db, Contract, payload, ContractResponse)
+
+
+@router.delete("/contracts", response_model=BulkDeleteResult)
+def bulk_delete_contracts(
+    ids: Optional[str] = Query(None, description="Comma-separated contract IDs to delete"),
+    status: Optional[str] = Query(None, description="Delete contracts with this status"),
+    expiring_within: Optional[int] = Query(None, description="Delete contracts expiring within N days"),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    """Delete every contract matching ``ids`` and/or the filters, with their clauses and notes."""
+    if ids is None and status is None and expiring_within is None:
+        raise HTTPException(status_code=400, detail="Pass ids or at least one filter")
+    stmt = apply_contract_filters(delete(Contract), status, expiring_within)
+    if ids is not None:
+        stmt = stmt.where(Contract.id.in_(parse_id_list(ids)))
+    return {"deleted": _delete_contracts(db, stmt)}
+
+
+@router.get("/contracts/{contract_id}", response_model=SparseContractDetailResponse)
+@read_endpoint
 def get_contract(
     contract_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    include: Optional[str] = Query(None, description=INCLUDE_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    return _get_or_404(db, contract_id)
+    includes = _parse_includes(include)
+    fieldset = FieldSet(Contract, ContractResponse, fields, list_view=False)
+    # Validators only track the contract row, so embedded responses are never conditional
+    if not includes and has_conditional_headers(request):
+        updated_at = db.scalar(select(Contract.updated_at).where(Contract.id == contract_id))
+        if updated_at is not None:
+            cached = not_modified(request, row_validators(updated_at, fieldset.variant))
+            if cached:
+                return cached
+    contract = _get_or_404(db, contract_id, fieldset, includes)
+    if includes:
+        return FastJSONResponse(_with_includes(db, [contract], includes, fieldset)[0])
+    response = fieldset.response(contract)
+    set_validators(response, row_validators(contract.updated_at, fieldset.variant))
+    return response
 
 
 @router.put("/contracts/{contract_id}", response_model=ContractResponse)
@@ -89,27 +310,54 @@ def update_contract(
     for field, value in update_data.items():
         setattr(contract, field, value)
     db.commit()
+    invalidate_dashboards()
     db.refresh(contract)
     return contract
 
 
+@router.patch("/contracts/{contract_id}", response_model=ContractResponse)
+def patch_contract(
+    contract_id: int,
+    payload: ContractUpdate,
+    if_match: Optional[str] = Header(None, description=IF_MATCH_DESCRIPTION),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    values = payload.model_dump(exclude_unset=True)
+    row = patch_row(db, Contract, contract_id, values, f"Contract {contract_id} not found", if_match)
+    response = FieldSet(Contract, ContractResponse, None, list_view=False).response(row)
+    set_validators(response, row_validators(row.updated_at))
+    return response
+
+
 @router.delete("/contracts/{contract_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_contract(
     contract_id: int,
     db: Session = Depends(get_db),
     _: str = Depends(verify_api_key),
 ):
-    contract = _get_or_404(db, contract_id)
-    db.delete(contract)
-    db.commit()
+    if not _delete_contracts(db, delete(Contract).where(Contract.id == contract_id)):
+        raise HTTPException(status_code=404, detail=f"Contract {contract_id} not found")
 
 
-@router.get("/contracts/{contract_id}/clauses", response_model=List[ClauseResponse])
+@router.get("/contracts/{contract_id}/clauses", response_model=Page[SparseClauseResponse])
+@read_endpoint
 def list_contract_clauses(
     contract_id: int,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    _get_or_404(db, contract_id)
-    clauses = db.query(Clause).filter(Clause.contract_id == contract_id).all()
-    return clauses
+    fieldset = FieldSet(Clause, ClauseResponse, fields, list_view=True)
+    query = db.query(Clause).filter(Clause.contract_id == contract_id)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.filter(Clause.id > last_id)
+    query = fieldset.apply(query.order_by(Clause.id.asc()))
+    page = fetch_page(query, limit, lambda c: (c.id,))
+    # Only an empty page needs the existence check to tell "no clauses" from a 404
+    if not page["items"] and db.scalar(select(Contract.id).where(Contract.id == contract_id)) is None:
+        raise HTTPException(status_code=404, detail=f"Contract {contract_id} not found")
+    return fieldset.page_response(page)
@@ -1,79 +1,98 @@
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..auth import verify_api_key
-from ..database import get_db
+from ..cache import dashboard_cache
+from ..database import get_async_read_db, get_read_db
 from ..models import ComplianceItem, ComplianceStatus, Contract, ContractStatus
 from ..schemas import ComplianceBreakdown, DashboardResponse
 
 router = APIRouter()
+async_router = APIRouter()
 
 EXPIRING_SOON_DAYS = 30
 
 
-@router.get("/dashboard", response_model=DashboardResponse)
-def get_dashboard(
-    db: Session = Depends(get_db),
-    _: str = Depends(verify_api_key),
-):
-    today = date.today()
-    deadline_30 = today + timedelta(days=EXPIRING_SOON_DAYS)
+def _dashboard_statement(today: date):
+    """Build the single dashboard query; executed by both the sync and async routes.
 
-    # Active contracts and their total value
-    active_contracts = (
-        db.query(Contract)
-        .filter(Contract.status == ContractStatus.active)
-        .all()
-    )
-    active_contracts_count = len(active_contracts)
-    total_contract_value = sum(c.value or 0.0 for c in active_contracts)
+    Two one-row aggregate subqueries are cross-joined: the contract side only
+    reads active contracts, the compliance side counts every status with
+    conditional aggregates in one pass over compliance_items.
+    """
+    deadline_30 = today + timedelta(days=EXPIRING_SOON_DAYS)
 
-    # Contracts expiring within 30 days (active only)
-    expiring_soon_count = (
-        db.query(func.count(Contract.id))
-        .filter(
-            Contract.status == ContractStatus.active,
-            Contract.end_date.isnot(None),
-            Contract.end_date >= today,
-            Contract.end_date <= deadline_30,
+    contracts = (
+        select(
+            func.count().label("active_contracts_count"),
+            func.coalesce(func.sum(Contract.value), 0.0).label("total_contract_value"),
+            func.count()
+            .filter(
+                Contract.end_date.isnot(None),
+                Contract.end_date >= today,
+                Contract.end_date <= deadline_30,
+            )
+            .label("expiring_soon_count"),
         )
-        .scalar()
-        or 0
+        .where(Contract.status == ContractStatus.active)
+        .subquery()
     )
 
-    # Compliance status breakdown
-    status_rows = (
-        db.query(ComplianceItem.status, func.count(ComplianceItem.id))
-        .group_by(ComplianceItem.status)
-        .all()
-    )
-    counts = {row[0]: row[1] for row in status_rows}
-    compliance_status = ComplianceBreakdown(
-        compliant=counts.get(ComplianceStatus.compliant, 0),
-        non_compliant=counts.get(ComplianceStatus.non_compliant, 0),
-        pending=counts.get(ComplianceStatus.pending, 0),
-        expiring=counts.get(ComplianceStatus.expiring, 0),
-    )
-
-    # Overdue compliance items: past due_date and not compliant
-    overdue_compliance_items = (
-        db.query(func.count(ComplianceItem.id))
+    compliance = select(
+        *(
+            func.count().filter(ComplianceItem.status == s).label(s.value)
+            for s in ComplianceStatus
+        ),
+        # Overdue compliance items: past due_date and not compliant
+        func.count()
         .filter(
             ComplianceItem.due_date.isnot(None),
             ComplianceItem.due_date < today,
             ComplianceItem.status != ComplianceStatus.compliant,
         )
-        .scalar()
-        or 0
-    )
+        .label("overdue_compliance_items"),
+    ).subquery()
+
+    return select(contracts, compliance).select_from(contracts.join(compliance, true()))
 
+
+def _build_response(row) -> DashboardResponse:
     return DashboardResponse(
-        active_contracts_count=active_contracts_count,
-        total_contract_value=total_contract_value,
-        expiring_soon_count=expiring_soon_count,
-        compliance_status=compliance_status,
-        overdue_compliance_items=overdue_compliance_items,
+        active_contracts_count=row.active_contracts_count,
+        total_contract_value=row.total_contract_value or 0.0,
+        expiring_soon_count=row.expiring_soon_count,
+        compliance_status=ComplianceBreakdown(
+            **{s.value: getattr(row, s.value) for s in ComplianceStatus}
+        ),
+        overdue_compliance_items=row.overdue_compliance_items,
     )
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+def get_dashboard(
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    today = date.today()
+    cached = dashboard_cache.get(today)
+    if cached is None:
+        cached = _build_response(db.execute(_dashboard_statement(today)).one())
+        dashboard_cache.set(today, cached)
+    return cached
+
+
+@async_router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard_async(
+    db: AsyncSession = Depends(get_async_read_db),
+    _: str = Depends(verify_api_key),
+):
+    today = date.today()
+    cached = dashboard_cache.get(today)
+    if cached is None:
+        cached = _build_response((await db.execute(_dashboard_statement(today))).one())
+        dashboard_cache.set(today, cached)
+    return cached
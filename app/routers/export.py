@@ -0,0 +1,106 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from ..auth import verify_api_key
+from ..database import open_read_session, reads_from_primary
+from ..models import Clause, ComplianceItem, Contract
+from .clauses import apply_clause_filters
+from .compliance import apply_compliance_filters
+from .contracts import apply_contract_filters
+
+router = APIRouter()
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 2000
+
+FORMAT_PATTERN = "^(csv|ndjson)$"
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _stream(stmt, columns, fmt: str, primary: bool) -> Iterator[str]:
+    # The session is owned by the generator, not by get_read_db: it has to
+    # stay open until the last row has been sent, long after the handler returned.
+    db = open_read_session(primary)
+    try:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(columns)
+            for rows in result.partitions():
+                writer.writerows([_plain(v) for v in row] for row in rows)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+            if buf.tell():
+                yield buf.getvalue()
+        else:
+            for rows in result.partitions():
+                yield "".join(
+                    json.dumps({c: _plain(v) for c, v in zip(columns, row)}) + "\n"
+                    for row in rows
+                )
+    finally:
+        db.close()
+
+
+def _export_response(request: Request, model, query, fmt: str, name: str) -> StreamingResponse:
+    columns = [c.name for c in model.__table__.columns]
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream(query.order_by(model.id.asc()), columns, fmt, reads_from_primary(request)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/export/contracts")
+def export_contracts(
+    request: Request,
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by contract status"),
+    expiring_within: Optional[int] = Query(None, description="Filter contracts expiring within N days"),
+    _: str = Depends(verify_api_key),
+):
+    query = apply_contract_filters(select(Contract.__table__), status, expiring_within)
+    return _export_response(request, Contract, query, format, "contracts")
+
+
+@router.get("/export/clauses")
+def export_clauses(
+    request: Request,
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv or ndjson"),
+    contract_id: Optional[int] = Query(None, description="Filter by contract ID"),
+    risk_level: Optional[str] = Query(None, description="Filter by risk level"),
+    _: str = Depends(verify_api_key),
+):
+    query = apply_clause_filters(select(Clause.__table__), contract_id, risk_level)
+    return _export_response(request, Clause, query, format, "clauses")
+
+
+@router.get("/export/compliance")
+def export_compliance_items(
+    request: Request,
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by compliance status"),
+    due_within: Optional[int] = Query(None, description="Filter items due within N days"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    _: str = Depends(verify_api_key),
+):
+    query = apply_compliance_filters(select(ComplianceItem.__table__), status, due_within, category)
+    return _export_response(request, ComplianceItem, query, format, "compliance")
@@ -0,0 +1,23 @@
+import io
+
+from fastapi import APIRouter, Depends, File, Path, UploadFile
+from sqlalchemy.orm import Session
+
+from ..auth import verify_api_key
+from ..database import get_db
+from ..importer import import_csv
+from ..schemas import ImportReport
+
+router = APIRouter()
+
+
+@router.post("/import/{entity}", response_model=ImportReport)
+def import_entity(
+    entity: str = Path(..., pattern="^(contracts|clauses|compliance)$"),
+    file: UploadFile = File(..., description="CSV with a header row of create-schema field names"),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    """Bulk-load a CSV file in one transaction; invalid rows are reported, not loaded."""
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    return import_csv(db, entity, lines)
@@ -1,39 +1,78 @@
+from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ..auth import verify_api_key
-from ..database import get_db
+from ..bulk import IDS_DESCRIPTION, MAX_BULK_ITEMS, bulk_insert, fetch_by_ids, parse_id_list
+from ..cache import invalidate_dashboards
+from ..database import get_db, get_read_db, read_endpoint
+from ..fields import FIELDS_DESCRIPTION, FieldSet
+from ..matching import MATCH_PATTERN, TextMatcher
 from ..models import LegalNote
-from ..schemas import LegalNoteCreate, LegalNoteResponse, LegalNoteUpdate
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, cursor_timestamp, decode_cursor, fetch_page
+from ..schemas import IdsPage, LegalNoteCreate, LegalNoteResponse, LegalNoteUpdate, SparseLegalNoteResponse
+from ..updates import patch_row
 
 router = APIRouter()
 
 
-def _get_or_404(db: Session, note_id: int) -> LegalNote:
-    note = db.query(LegalNote).filter(LegalNote.id == note_id).first()
+def _get_or_404(db: Session, note_id: int, fieldset: Optional[FieldSet] = None) -> LegalNote:
+    if fieldset is None or fieldset.complete:
+        note = db.get(LegalNote, note_id)
+    else:
+        note = fieldset.apply(db.query(LegalNote)).filter(LegalNote.id == note_id).first()
     if not note:
         raise HTTPException(status_code=404, detail=f"Legal note {note_id} not found")
     return note
 
 
-@router.get("/notes", response_model=List[LegalNoteResponse])
+@router.get("/notes", response_model=IdsPage[SparseLegalNoteResponse])
+@read_endpoint
 def list_notes(
     reference_type: Optional[str] = Query(None, description="Filter by reference type"),
     reference_id: Optional[int] = Query(None, description="Filter by reference ID"),
-    author: Optional[str] = Query(None, description="Filter by author (partial match)"),
-    db: Session = Depends(get_db),
+    author: Optional[str] = Query(None, description="Filter by author (partial or fuzzy match)"),
+    match: str = Query(
+        "substring", pattern=MATCH_PATTERN, description="Text filter mode: substring or fuzzy (ranked by similarity)"
+    ),
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
+    fieldset = FieldSet(LegalNote, LegalNoteResponse, fields, list_view=True)
     query = db.query(LegalNote)
     if reference_type:
         query = query.filter(LegalNote.reference_type == reference_type)
     if reference_id is not None:
         query = query.filter(LegalNote.reference_id == reference_id)
+    matcher = TextMatcher(db, match)
     if author:
-        query = query.filter(LegalNote.author.ilike(f"%{author}%"))
-    return query.order_by(LegalNote.created_at.desc()).all()
+        query = matcher.apply(query, LegalNote.author, author)
+    if ids is not None:
+        return fieldset.page_response(fetch_by_ids(fieldset.apply(query), LegalNote.id, parse_id_list(ids)))
+    if matcher.ranked:
+        return fieldset.page_response(matcher.ranked_page(fieldset.apply(query), limit, LegalNote.id))
+
+    # Keyset on (created_at desc, id desc)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor, datetime.fromisoformat, int)
+        created_at = cursor_timestamp(db, created_at)
+        query = query.filter(
+            or_(
+                LegalNote.created_at < created_at,
+                and_(LegalNote.created_at == created_at, LegalNote.id < last_id),
+            )
+        )
+
+    query = query.order_by(LegalNote.created_at.desc(), LegalNote.id.desc())
+    query = fieldset.apply(query, LegalNote.created_at)
+    return fieldset.page_response(fetch_page(query, limit, lambda n: (n.created_at, n.id)))
 
 
 @router.post("/notes", response_model=LegalNoteResponse, status_code=status.HTTP_201_CREATED)
@@ -45,17 +84,30 @@ def create_note(
     note = LegalNote(**payload.model_dump())
     db.add(note)
     db.commit()
+    invalidate_dashboards()
     db.refresh(note)
     return note
 
 
-@router.get("/notes/{note_id}", response_model=LegalNoteResponse)
+@router.post("/notes/bulk", response_model=List[LegalNoteResponse], status_code=status.HTTP_201_CREATED)
+def bulk_create_notes(
+    payload: List[LegalNoteCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    return bulk_insert(db, LegalNote, payload, LegalNoteResponse)
+
+
+@router.get("/notes/{note_id}", response_model=SparseLegalNoteResponse)
+@read_endpoint
 def get_note(
     note_id: int,
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     _: str = Depends(verify_api_key),
 ):
-    return _get_or_404(db, note_id)
+    fieldset = FieldSet(LegalNote, LegalNoteResponse, fields, list_view=False)
+    return fieldset.response(_get_or_404(db, note_id, fieldset))
 
 
 @router.put("/notes/{note_id}", response_model=LegalNoteResponse)
@@ -69,10 +121,23 @@ def update_note(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(note, field, value)
     db.commit()
+    invalidate_dashboards()
     db.refresh(note)
     return note
 
 
+@router.patch("/notes/{note_id}", response_model=LegalNoteResponse)
+def patch_note(
+    note_id: int,
+    payload: LegalNoteUpdate,
+    db: Session = Depends(get_db),
+    _: str = Depends(verify_api_key),
+):
+    values = payload.model_dump(exclude_unset=True)
+    row = patch_row(db, LegalNote, note_id, values, f"Legal note {note_id} not found")
+    return FieldSet(LegalNote, LegalNoteResponse, None, list_view=False).response(row)
+
+
 @router.delete("/notes/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_note(
     note_id: int,
@@ -82,3 +147,4 @@ def delete_note(
     note = _get_or_404(db, note_id)
     db.delete(note)
     db.commit()
+    invalidate_dashboards()
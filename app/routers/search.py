@@ -0,0 +1,157 @@
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, literal, literal_column, select, text, union_all
+from sqlalchemy.orm import Session
+
+from ..auth import verify_api_key
+from ..database import get_read_db, read_endpoint
+from ..models import Clause, Contract, LegalNote
+from ..pagination import decode_cursor, encode_cursor
+from ..schemas import Page, SearchHit
+
+router = APIRouter()
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# Must match the expressions indexed by migration 0002 for the GIN index to be used
+REGCONFIG = literal_column("'english'::regconfig")
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=8, StartSel=<mark>, StopSel=</mark>"
+
+# entity -> (model, searched column, title column)
+SOURCES = {
+    "contract": (Contract, Contract.summary, Contract.title),
+    "clause": (Clause, Clause.text, Clause.summary),
+    "note": (LegalNote, LegalNote.content, LegalNote.author),
+}
+
+
+def _parse_types(types: Optional[str]) -> List[str]:
+    if not types:
+        return list(SOURCES)
+    selected = [t.strip() for t in types.split(",") if t.strip()]
+    unknown = [t for t in selected if t not in SOURCES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid types {unknown}. Must be among: {list(SOURCES)}",
+        )
+    return selected
+
+
+def _titles(db: Session, entity: str, ids: List[int]) -> Dict[int, Optional[str]]:
+    model, _, title = SOURCES[entity]
+    return dict(db.execute(select(model.id, title).where(model.id.in_(ids))).all())
+
+
+def _offset(value) -> int:
+    offset = int(value)
+    if offset < 0:
+        raise ValueError("negative offset")
+    return offset
+
+
+def _search_postgres(db: Session, q: str, types: List[str], limit: int, offset: int) -> list:
+    tsquery = func.websearch_to_tsquery(REGCONFIG, q)
+    ranked = []
+    for entity in types:
+        model, column, _ = SOURCES[entity]
+        vector = func.to_tsvector(REGCONFIG, column)
+        ranked.append(
+            select(
+                literal(entity).label("entity"),
+                model.id.label("id"),
+                func.ts_rank(vector, tsquery).label("rank"),
+            ).where(vector.op("@@")(tsquery))
+        )
+    matches = union_all(*ranked).subquery()
+    rows = db.execute(
+        select(matches.c.entity, matches.c.id, matches.c.rank)
+        .order_by(matches.c.rank.desc(), matches.c.entity, matches.c.id)
+        .offset(offset)
+        .limit(limit + 1)
+    ).all()
+
+    # Headlines are expensive, so only build them for the rows on this page;
+    # the extra row only tells the caller that there is a next page
+    page = rows[:limit]
+    snippets = {}
+    for entity in {r.entity for r in page}:
+        model, column, title = SOURCES[entity]
+        ids = [r.id for r in page if r.entity == entity]
+        for row in db.execute(
+            select(model.id, title, func.ts_headline(REGCONFIG, column, tsquery, HEADLINE_OPTIONS)).where(
+                model.id.in_(ids)
+            )
+        ):
+            snippets[(entity, row[0])] = (row[1], row[2])
+
+    hits = []
+    for r in rows:
+        title, snippet = snippets.get((r.entity, r.id), (None, ""))
+        hits.append(SearchHit(entity=r.entity, id=r.id, title=title, snippet=snippet or "", rank=r.rank))
+    return hits
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every term so user input is never parsed as FTS5 query syntax
+    return " ".join('"%s"' % term.replace('"', '""') for term in q.split())
+
+
+def _search_sqlite(db: Session, q: str, types: List[str], limit: int, offset: int) -> list:
+    placeholders = ", ".join(f":t{i}" for i in range(len(types)))
+    rows = db.execute(
+        text(
+            "SELECT entity, ref_id, -bm25(search_index) AS rank, "
+            "snippet(search_index, 2, '<mark>', '</mark>', '…', 16) AS snippet "
+            "FROM search_index WHERE search_index MATCH :q "
+            f"AND entity IN ({placeholders}) "
+            "ORDER BY bm25(search_index), entity, ref_id LIMIT :limit OFFSET :offset"
+        ),
+        {"q": _fts5_query(q), "limit": limit + 1, "offset": offset, **{f"t{i}": t for i, t in enumerate(types)}},
+    ).all()
+    titles = {
+        entity: _titles(db, entity, [r.ref_id for r in rows if r.entity == entity])
+        for entity in {r.entity for r in rows}
+    }
+    return [
+        SearchHit(
+            entity=r.entity,
+            id=r.ref_id,
+            title=titles[r.entity].get(r.ref_id),
+            snippet=r.snippet,
+            rank=r.rank,
+        )
+        for r in rows
+    ]
+
+
+@router.get("/search", response_model=Page[SearchHit])
+@read_endpoint
+def search(
+    q: str = Query(..., min_length=1, description="Search terms (web-search syntax on PostgreSQL)"),
+    types: Optional[str] = Query(None, description="Comma-separated subset of contract,clause,note"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT, description="Page size"),
+    db: Session = Depends(get_read_db),
+    _: str = Depends(verify_api_key),
+):
+    """Ranked full-text search over contract summaries, clause text and note content."""
+    selected = _parse_types(types)
+    # Results are ordered by relevance, so the cursor carries an offset
+    offset = decode_cursor(cursor, _offset)[0] if cursor else 0
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        hits = _search_postgres(db, q, selected, limit, offset)
+    elif dialect == "sqlite":
+        hits = _search_sqlite(db, q, selected, limit, offset)
+    else:
+        raise HTTPException(status_code=501, detail="Full-text search is not supported on this database")
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor([offset + limit])
+    return {"items": hits, "next_cursor": next_cursor}
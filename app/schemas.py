@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, Generic, List, Optional, Type, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 from .models import (
     ClauseType,
@@ -14,6 +14,24 @@ from .models import (
     RiskLevel,
 )
 
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Pagination
+# ---------------------------------------------------------------------------
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class IdsPage(Page[T], Generic[T]):
+    """A page from a list endpoint that also accepts ``ids=``."""
+
+    # Only present for ids= lookups: requested IDs that were not found
+    missing_ids: Optional[List[int]] = None
+
 
 # ---------------------------------------------------------------------------
 # Contract schemas
@@ -198,6 +216,50 @@ class LegalNoteResponse(LegalNoteBase):
     created_at: datetime
 
 
+class ContractDetailResponse(ContractResponse):
+    """A contract with the related rows requested via ``include``; omitted unless requested."""
+
+    clauses: Optional[List[ClauseResponse]] = None
+    notes: Optional[List[LegalNoteResponse]] = None
+
+
+# ---------------------------------------------------------------------------
+# Sparse response schemas (list and get endpoints)
+# ---------------------------------------------------------------------------
+
+def _drop_default(schema: dict) -> None:
+    # The field may be absent, but it is never filled in with null
+    schema.pop("default", None)
+
+
+def sparse_model(schema: Type[BaseModel]) -> Type[BaseModel]:
+    """A copy of a response schema in which only ``id`` is required.
+
+    Documents what the list and get endpoints actually return: the fields
+    named in ``fields=``, and in list views everything but the large text
+    fields by default.
+    """
+    fields = {
+        name: (field.annotation, Field(None, json_schema_extra=_drop_default)) if name != "id" else (int, ...)
+        for name, field in schema.model_fields.items()
+    }
+    return create_model(
+        f"Sparse{schema.__name__}",
+        __doc__=(
+            f"{schema.__name__} fields selected with fields=; list views omit "
+            "large text fields unless they are requested by name."
+        ),
+        **fields,
+    )
+
+
+SparseContractDetailResponse = sparse_model(ContractDetailResponse)
+SparseClauseResponse = sparse_model(ClauseResponse)
+SparseComplianceItemResponse = sparse_model(ComplianceItemResponse)
+SparseLegalContactResponse = sparse_model(LegalContactResponse)
+SparseLegalNoteResponse = sparse_model(LegalNoteResponse)
+
+
 # ---------------------------------------------------------------------------
 # Dashboard schema
 # ---------------------------------------------------------------------------
@@ -215,3 +277,86 @@ class DashboardResponse(BaseModel):
     expiring_soon_count: int
     compliance_status: ComplianceBreakdown
     overdue_compliance_items: int
+
+
+# ---------------------------------------------------------------------------
+# Search schemas
+# ---------------------------------------------------------------------------
+
+class SearchHit(BaseModel):
+    entity: str
+    id: int
+    title: Optional[str] = None
+    snippet: str
+    rank: float
+
+
+# ---------------------------------------------------------------------------
+# Import schemas
+# ---------------------------------------------------------------------------
+
+class ImportRowError(BaseModel):
+    line: int
+    errors: List[str]
+
+
+class ImportReport(BaseModel):
+    entity: str
+    processed: int = 0
+    imported: int = 0
+    rejected: int = 0
+    errors: List[ImportRowError] = []
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: int
+
+
+# ---------------------------------------------------------------------------
+# Analytics schemas
+# ---------------------------------------------------------------------------
+
+# Buckets only carry the dimensions that were grouped by
+class ContractValueBucket(BaseModel):
+    type: Optional[ContractType] = None
+    status: Optional[ContractStatus] = None
+    currency: str
+    start_month: Optional[date] = None
+    contracts: int
+    total_value: float
+
+
+class ClauseRiskBucket(BaseModel):
+    risk_level: Optional[RiskLevel] = None
+    type: Optional[ClauseType] = None
+    clauses: int
+
+
+class ComplianceBucket(BaseModel):
+    category: Optional[ComplianceCategory] = None
+    status: Optional[ComplianceStatus] = None
+    due_month: Optional[date] = None
+    items: int
+
+
+class Rollup(BaseModel, Generic[T]):
+    # When the rollup tables were last rebuilt, so how stale the figures are; None if never
+    refreshed_at: Optional[datetime] = None
+    items: List[T]
+
+
+# ---------------------------------------------------------------------------
+# Operational schemas
+# ---------------------------------------------------------------------------
+
+class PoolStatsResponse(BaseModel):
+    size: Optional[int] = None
+    checked_out: Optional[int] = None
+    checked_in: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: int
+    checkout_timeouts: int
+    wait_ms_total: float
+    wait_ms_buckets: Dict[str, int]
+    # The async primary pool, under DATABASE_ASYNC
+    async_reads: Optional["PoolStatsResponse"] = None
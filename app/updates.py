@@ -0,0 +1,52 @@
+"""Single-statement partial updates for the ``PATCH /{entity}/{id}`` endpoints.
+
+A PATCH is one ``UPDATE ... WHERE id = :id RETURNING *``; with an
+``If-Match`` header the statement also requires ``updated_at`` to match the
+version in the ETag (optimistic concurrency). Only when no row comes back is
+a second query needed, and only to tell a stale ``If-Match`` (412) from a
+missing row (404).
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from .cache import invalidate_dashboards
+from .conditional import parse_if_match
+
+
+def _version_in(db: Session, column, versions: List[datetime]):
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite keeps timestamps as text, written in more than one format
+        # (CURRENT_TIMESTAMP vs. bound parameters), so compare normalised values
+        return func.datetime(column).in_([v.strftime("%Y-%m-%d %H:%M:%S") for v in versions])
+    return column.in_(versions)
+
+
+def patch_row(db: Session, model, row_id: int, values: dict, not_found: str, if_match: Optional[str] = None):
+    """Apply ``values`` to one row and return it as a ``Row`` of all columns.
+
+    Raises 404 with ``not_found`` if the row does not exist, and 412 if it
+    exists but ``if_match`` names none of its current versions.
+    """
+    if not values:
+        raise HTTPException(status_code=422, detail="Request body sets no fields")
+
+    stmt = update(model).where(model.id == row_id).values(**values)
+    versions = parse_if_match(if_match) if if_match is not None else None
+    if versions is not None:
+        stmt = stmt.where(_version_in(db, model.updated_at, versions))
+    row = db.execute(stmt.returning(*model.__table__.columns)).first()
+
+    if row is None:
+        db.rollback()
+        if if_match is not None and db.scalar(select(model.id).where(model.id == row_id)) is not None:
+            raise HTTPException(status_code=412, detail="If-Match does not match the current version")
+        raise HTTPException(status_code=404, detail=not_found)
+
+    db.commit()
+    invalidate_dashboards()
+    return row
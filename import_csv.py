@@ -0,0 +1,44 @@
+"""
+Bulk CSV import — run from the project root:
+
+    DATABASE_URL=postgresql://... python import_csv.py contracts contracts.csv
+
+ENTITY is one of contracts, clauses or compliance. The file needs a header
+row using the field names of the matching create schema. All rows load in
+one transaction (via COPY on PostgreSQL). Progress goes to stderr. The final
+report, with the line numbers of rejected rows, is printed as JSON.
+"""
+
+import argparse
+import sys
+import time
+
+from app.database import SessionLocal
+from app.importer import IMPORT_BATCH_SIZE, IMPORTERS, import_csv
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entity", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="CSV file, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    def progress(report):
+        elapsed = time.perf_counter() - started
+        print(
+            f"{report.processed} rows read, {report.rejected} rejected "
+            f"({report.processed / elapsed:,.0f} rows/s)",
+            file=sys.stderr,
+        )
+
+    source = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8-sig")
+    db = SessionLocal()
+    try:
+        report = import_csv(db, args.entity, source, batch_size=args.batch_size, progress=progress)
+    finally:
+        db.close()
+        source.close()
+    print(report.model_dump_json(indent=2))
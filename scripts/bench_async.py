@@ -0,0 +1,82 @@
+"""
+Compare requests/sec of the sync and async dashboard routes on the same box:
+
+    GDEV_API_TOKEN=secret DATABASE_URL=postgresql://... python scripts/bench_async.py
+
+Both variants are served in-process through the ASGI transport, against the
+same database, with the same concurrency. The sync route runs on Starlette's
+worker threadpool (40 threads by default); the async route runs on the event
+loop with asyncpg. Results are printed as one JSON object per variant.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+os.environ["DATABASE_ASYNC"] = "1"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.database import async_engine, engine  # noqa: E402
+from app.routers import dashboard  # noqa: E402
+
+
+def build_app(router) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int, api_key: str) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"X-API-Key": api_key}
+    remaining = iter(range(requests))
+    errors = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up connection pools before timing
+        await client.get("/api/v1/dashboard", headers=headers)
+
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                resp = await client.get("/api/v1/dashboard", headers=headers)
+                if resp.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(requests / elapsed, 1),
+    }
+
+
+async def amain(args) -> None:
+    api_key = os.getenv("GDEV_API_TOKEN", "")
+    for name, router in (("sync", dashboard.router), ("async", dashboard.async_router)):
+        result = await run(build_app(router), args.requests, args.concurrency, api_key)
+        print(json.dumps({"variant": name, **result}))
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    asyncio.run(amain(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
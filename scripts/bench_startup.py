@@ -0,0 +1,84 @@
+"""
+Measure worker startup, phase by phase, in fresh interpreters:
+
+    GDEV_API_TOKEN=secret DATABASE_URL=postgresql://... python scripts/bench_startup.py [--runs 5]
+
+Each run starts a new Python process and times:
+
+- ``import_ms``: importing the application modules (models, routers...);
+- ``app_build_ms``: importing ``app.main``, which builds the FastAPI app;
+- ``startup_ms``: the lifespan startup (schema check, optional seeding);
+- ``first_request_ms``: the first ``GET /api/v1/contracts?limit=1``.
+
+It also counts the SQL statements run during startup
+(``startup_queries``). The database should already be migrated, as it
+is for every worker after the first, so the numbers reflect a routine
+restart. Results are printed as one JSON object with the median of each
+metric over the runs.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def child() -> None:
+    sys.path.insert(0, ROOT)
+    started = time.perf_counter()
+    import app.routers.contracts  # noqa: F401
+    import app.routers.search  # noqa: F401
+    imported = time.perf_counter()
+    from app.main import app
+    built = time.perf_counter()
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from app.database import engine
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    headers = {"X-API-Key": os.getenv("GDEV_API_TOKEN", "")}
+    with TestClient(app) as client:
+        started_up = time.perf_counter()
+        startup_queries = len(statements)
+        resp = client.get("/api/v1/contracts", params={"limit": 1}, headers=headers)
+        first = time.perf_counter()
+    resp.raise_for_status()
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "app_build_ms": (built - imported) * 1000,
+        "startup_ms": (started_up - built) * 1000,
+        "first_request_ms": (first - started_up) * 1000,
+        "startup_queries": startup_queries,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"], capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    result = {key: round(statistics.median(r[key] for r in runs), 1) for key in runs[0]}
+    total = result["import_ms"] + result["app_build_ms"] + result["startup_ms"] + result["first_request_ms"]
+    print(json.dumps({"runs": args.runs, **result, "total_ms": round(total, 1)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Boot the app against an empty database and check the schema it ends up with:
+
+    GDEV_API_TOKEN=secret DATABASE_URL=postgresql://.../empty_db python scripts/check_fresh_schema.py
+
+The lifespan startup migrates the database, as on a first deploy. Every
+table declared on ``Base`` must then exist with all of its columns: the
+application's own, the rollup tables and the ones viv_auth registers
+through ``init_auth``. This catches migrations that miss a table or drift
+from the models. The schema must also be at ``LATEST_VERSION``.
+
+Exit status is 1 when anything is missing, and 2 when the database was not
+empty to begin with.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import inspect  # noqa: E402
+
+from app.database import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.migrations import LATEST_VERSION, schema_migrations, schema_version  # noqa: E402
+
+
+def main() -> int:
+    existing = inspect(engine).get_table_names()
+    if existing:
+        print(f"Database is not empty ({len(existing)} tables); point DATABASE_URL at a new database.")
+        return 2
+
+    with TestClient(app):
+        pass
+
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    failures = 0
+    for table in [schema_migrations, *Base.metadata.sorted_tables]:
+        if table.name not in tables:
+            status = "missing"
+        else:
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            absent = [column.name for column in table.columns if column.name not in columns]
+            status = "missing columns " + ", ".join(absent) if absent else "ok"
+        print(f"{table.name:30} {status}")
+        failures += status != "ok"
+
+    version = schema_version(engine)
+    print(f"{'schema version':30} {version} (latest {LATEST_VERSION})")
+    failures += version != LATEST_VERSION
+
+    if failures:
+        print(f"\n{failures} problem{'' if failures == 1 else 's'} with the fresh schema.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
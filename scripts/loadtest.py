@@ -0,0 +1,232 @@
+"""
+Load-test the /api/v1 endpoints and report latency percentiles and throughput:
+
+    GDEV_API_TOKEN=secret DATABASE_URL=sqlite:///./bench.db python scripts/loadtest.py
+    GDEV_API_TOKEN=secret python scripts/loadtest.py --url http://localhost:8000 --concurrency 50
+    GDEV_API_TOKEN=secret python scripts/loadtest.py --output run.json --baseline previous.json
+
+Without ``--url`` the app is served in-process through the ASGI transport,
+against ``DATABASE_URL`` (SQLite or a local PostgreSQL). The database should
+already hold data, e.g. from ``python seed.py --scale 10``. IDs for the
+``/{id}`` endpoints are sampled from the first page of each list.
+
+Each scenario sends ``--requests`` requests from ``--concurrency`` workers
+after a short warm-up. Results are printed as one JSON object per scenario:
+p50/p95/p99 latency in ms, requests per second and error count.
+``--output`` also writes the whole run as one JSON document. ``--baseline``
+adds the relative change of each metric against such a document, so runs
+can be compared with each other. Write scenarios are opt-in (``--writes``);
+they add notes and touch contract titles.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx  # noqa: E402
+
+# name: (method, path template, JSON body or None); {contract_id} etc. come from sampled IDs
+READ_SCENARIOS = {
+    "list_contracts": ("GET", "/api/v1/contracts", None),
+    "list_contracts?status": ("GET", "/api/v1/contracts?status=active", None),
+    "list_contracts?expiring_within": ("GET", "/api/v1/contracts?expiring_within=90", None),
+    "list_contracts?title": ("GET", "/api/v1/contracts?title=cloud", None),
+    "list_contracts?include": ("GET", "/api/v1/contracts?include=clauses,notes", None),
+    "list_contracts?ids": ("GET", "/api/v1/contracts?ids={contract_ids}", None),
+    "get_contract": ("GET", "/api/v1/contracts/{contract_id}", None),
+    "get_contract?include": ("GET", "/api/v1/contracts/{contract_id}?include=clauses,notes", None),
+    "list_contract_clauses": ("GET", "/api/v1/contracts/{contract_id}/clauses", None),
+    "list_clauses": ("GET", "/api/v1/clauses", None),
+    "list_clauses?risk_level": ("GET", "/api/v1/clauses?risk_level=high", None),
+    "get_clause": ("GET", "/api/v1/clauses/{clause_id}", None),
+    "list_compliance": ("GET", "/api/v1/compliance", None),
+    "list_compliance?status": ("GET", "/api/v1/compliance?status=pending", None),
+    "get_compliance": ("GET", "/api/v1/compliance/{item_id}", None),
+    "list_contacts": ("GET", "/api/v1/contacts", None),
+    "get_contact": ("GET", "/api/v1/contacts/{contact_id}", None),
+    "list_notes": ("GET", "/api/v1/notes", None),
+    "get_note": ("GET", "/api/v1/notes/{note_id}", None),
+    "dashboard": ("GET", "/api/v1/dashboard", None),
+    "search": ("GET", "/api/v1/search?q=termination", None),
+    "export_compliance": ("GET", "/api/v1/export/compliance?format=ndjson", None),
+    "analytics_contract_value": ("GET", "/api/v1/analytics/contracts/value?group_by=type,start_month", None),
+    "analytics_clause_risk": ("GET", "/api/v1/analytics/clauses/risk?group_by=risk_level,type", None),
+    "analytics_compliance": ("GET", "/api/v1/analytics/compliance?group_by=category,status,due_month", None),
+}
+WRITE_SCENARIOS = {
+    "create_note": (
+        "POST",
+        "/api/v1/notes",
+        {"reference_type": "contract", "reference_id": "{contract_id}", "content": "Load test", "author": "loadtest"},
+    ),
+    "patch_contract": ("PATCH", "/api/v1/contracts/{contract_id}", {"title": "Load test {contract_id}"}),
+}
+# Sampled-ID placeholder: list endpoint the IDs are taken from
+ID_SOURCES = {
+    "contract_id": "/api/v1/contracts",
+    "clause_id": "/api/v1/clauses",
+    "item_id": "/api/v1/compliance",
+    "contact_id": "/api/v1/contacts",
+    "note_id": "/api/v1/notes",
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+async def sample_ids(client: httpx.AsyncClient, headers: dict) -> Dict[str, List[int]]:
+    ids = {}
+    for name, path in ID_SOURCES.items():
+        resp = await client.get(path, params={"limit": 100, "fields": "id"}, headers=headers)
+        resp.raise_for_status()
+        ids[name] = [item["id"] for item in resp.json()["items"]]
+    return ids
+
+
+def _fill(template, rng: random.Random, ids: Dict[str, List[int]]):
+    """Substitute random sampled IDs into a path or JSON body."""
+    if isinstance(template, dict):
+        return {k: _fill(v, rng, ids) for k, v in template.items()}
+    if not isinstance(template, str) or "{" not in template:
+        return template
+    values = {name: rng.choice(pool) if pool else 0 for name, pool in ids.items()}
+    values["contract_ids"] = ",".join(str(i) for i in rng.sample(ids["contract_id"], min(10, len(ids["contract_id"]))))
+    filled = template.format(**values)
+    # A body value that is only a placeholder stays an integer
+    return int(filled) if template.startswith("{") and filled.isdigit() else filled
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    headers: dict,
+    scenario,
+    ids: Dict[str, List[int]],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    method, path, body = scenario
+    rng = random.Random(0)
+    latencies: List[float] = []
+    errors = 0
+
+    async def send() -> None:
+        nonlocal errors
+        started = time.perf_counter()
+        resp = await client.request(method, _fill(path, rng, ids), json=_fill(body, rng, ids), headers=headers)
+        await resp.aread()
+        latencies.append(time.perf_counter() - started)
+        if resp.status_code >= 400:
+            errors += 1
+
+    for _ in range(warmup):
+        await send()
+    latencies.clear()
+    errors = 0
+
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            await send()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "method": method,
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "requests_per_sec": round(requests / elapsed, 1),
+    }
+
+
+def compare(result: dict, baseline: Optional[dict]) -> dict:
+    """Relative change of each metric against the same scenario in a baseline run."""
+    if not baseline:
+        return {}
+    return {
+        f"{metric}_change": round(result[metric] / baseline[metric] - 1, 3)
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "requests_per_sec")
+        if baseline.get(metric)
+    }
+
+
+def make_client(url: Optional[str]) -> httpx.AsyncClient:
+    if url:
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        return httpx.AsyncClient(base_url=url, limits=limits, timeout=60)
+    from app.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=60)
+
+
+async def amain(args) -> None:
+    headers = {"X-API-Key": os.getenv("GDEV_API_TOKEN", "")}
+    scenarios = dict(READ_SCENARIOS)
+    if args.writes:
+        scenarios.update(WRITE_SCENARIOS)
+    if args.only:
+        scenarios = {name: s for name, s in scenarios.items() if any(part in name for part in args.only.split(","))}
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {r["scenario"]: r for r in json.load(f)["results"]}
+
+    results = []
+    async with make_client(args.url) as client:
+        ids = await sample_ids(client, headers)
+        for name, scenario in scenarios.items():
+            result = await run_scenario(
+                client, headers, scenario, ids, args.requests, args.concurrency, args.warmup
+            )
+            result = {"scenario": name, **result}
+            result.update(compare(result, baseline.get(name)))
+            print(json.dumps(result), flush=True)
+            results.append(result)
+
+    if args.output:
+        run = {
+            "target": args.url or os.getenv("DATABASE_URL", "in-process"),
+            "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server; default serves the app in-process")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed requests before each scenario")
+    parser.add_argument("--only", help="Comma-separated substrings; run only scenarios whose name contains one")
+    parser.add_argument("--writes", action="store_true", help="Also run the write scenarios")
+    parser.add_argument("--output", help="Write the run as one JSON document to this file")
+    parser.add_argument("--baseline", help="JSON document from an earlier --output to compare against")
+    asyncio.run(amain(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
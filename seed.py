@@ -2,22 +2,43 @@
 Standalone seed script — run from the project root:
 
     GDEV_API_TOKEN=secret DATABASE_URL=postgresql://... python seed.py
+    DATABASE_URL=postgresql://... python seed.py --scale 100
 
-The script creates all tables (if they do not already exist) and then
-inserts sample records. It is safe to run multiple times: it skips
-seeding when contracts already exist in the database.
+The script applies any pending schema migrations (which create the tables
+on a new database) and then inserts sample records. It is safe to run
+multiple times: it skips seeding when contracts already exist in the database.
+
+With ``--scale N`` it inserts N units of synthetic data instead (1,000
+contracts per unit, with clauses, compliance items, contacts and notes in
+proportion; see ``app/datagen.py``). This always adds rows, even to a
+database that already has data.
 """
 
+import argparse
+import json
+import time
+
 from app.database import SessionLocal, engine
-from app import models
+from app.datagen import generate
+from app.migrations import apply_migrations
 from app.seed import seed_db
 
 
 if __name__ == "__main__":
-    models.Base.metadata.create_all(bind=engine)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, help="Insert this many units of synthetic data")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --scale")
+    args = parser.parse_args()
+
+    apply_migrations(engine)
     db = SessionLocal()
     try:
-        seed_db(db)
+        if args.scale:
+            started = time.perf_counter()
+            counts = generate(db, args.scale, seed=args.seed)
+            print(json.dumps({**counts, "seconds": round(time.perf_counter() - started, 1)}))
+        else:
+            seed_db(db)
         print("Done.")
     finally:
         db.close()
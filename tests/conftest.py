@@ -0,0 +1,59 @@
+"""Shared fixtures: the whole app, served in-process on a scratch database.
+
+The database is a new SQLite file unless ``TEST_DATABASE_URL`` names an
+empty PostgreSQL database. The app's lifespan migrates it once per session
+and every test starts from empty tables. The app is imported whole, so
+viv_auth (requirements.txt) must be installed:
+
+    pip install -r requirements-dev.txt && python -m pytest
+"""
+
+import os
+import tempfile
+
+import pytest
+
+API_KEY = "test-key"
+
+os.environ["DATABASE_URL"] = os.getenv(
+    "TEST_DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='legalpro-tests-')}/test.db"
+)
+os.environ["GDEV_API_TOKEN"] = API_KEY
+os.environ["ROLLUP_REFRESH_SECONDS"] = "0"
+for name in ("DATABASE_ASYNC", "DATABASE_REPLICA_URLS", "GDEV_API_KEYS", "GDEV_API_KEYS_FILE", "SEED_ON_STARTUP"):
+    os.environ.pop(name, None)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+
+from app.cache import invalidate_dashboards  # noqa: E402
+from app.database import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Clause, ComplianceItem, Contract, LegalContact, LegalNote  # noqa: E402
+
+# Children first, so the deletes never trip a foreign key
+TABLES = [model.__table__ for model in (Clause, LegalNote, Contract, ComplianceItem, LegalContact)]
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app, headers={"X-API-Key": API_KEY}) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def empty_tables(client):
+    yield
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.execute(delete(table))
+    invalidate_dashboards()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,29 @@
+"""Small helpers shared by the test modules."""
+
+
+def make_contract(client, **fields) -> dict:
+    body = {"title": "Master services agreement", "type": "service_agreement", "counterparty": "Acme", **fields}
+    resp = client.post("/api/v1/contracts", json=body)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def make_note(client, **fields) -> dict:
+    body = {"reference_type": "general", "content": "Call the counterparty", "author": "Dana", **fields}
+    resp = client.post("/api/v1/notes", json=body)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def walk(client, path: str, **params) -> list:
+    """Every page of a list endpoint, as a list of pages of ids."""
+    pages, cursor = [], None
+    while True:
+        resp = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        pages.append([item["id"] for item in body["items"]])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+        assert len(pages) < 100, f"{path} keeps returning a next_cursor: {pages[-3:]}"
@@ -0,0 +1,32 @@
+"""Analytics: figures come from the rollup tables, as of their last rebuild."""
+
+from app.database import engine
+from app.rollups import refresh_rollups
+
+from .helpers import make_contract
+
+
+def test_analytics_reflect_the_last_rebuild(client):
+    make_contract(client, type="nda", value=100.0)
+    refresh_rollups(engine, force=True)
+    body = client.get("/api/v1/analytics/contracts/value", params={"group_by": "type"}).json()
+    assert body["refreshed_at"] is not None
+    assert body["items"] == [{"type": "nda", "currency": "USD", "contracts": 1, "total_value": 100.0}]
+
+    # Writes show up only after the next rebuild
+    make_contract(client, type="nda", value=50.0)
+    stale = client.get("/api/v1/analytics/contracts/value", params={"group_by": "type"}).json()
+    assert stale["items"][0]["contracts"] == 1
+    refresh_rollups(engine, force=True)
+    fresh = client.get("/api/v1/analytics/contracts/value", params={"group_by": "type"}).json()
+    assert fresh["items"][0]["contracts"] == 2
+
+
+def test_analytics_routes_document_staleness(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    for path in ("/api/v1/analytics/contracts/value", "/api/v1/analytics/clauses/risk", "/api/v1/analytics/compliance"):
+        assert "refreshed_at" in paths[path]["get"]["description"]
+
+
+def test_unknown_group_by_is_a_400(client):
+    assert client.get("/api/v1/analytics/compliance", params={"group_by": "colour"}).status_code == 400
@@ -0,0 +1,21 @@
+"""API keys: a hashed multi-key registry; unknown keys get a 401."""
+
+from app.auth import APIKeyRegistry, hash_api_key
+
+
+def test_requests_without_a_valid_key_are_rejected(client):
+    assert client.get("/api/v1/contracts", headers={"X-API-Key": "wrong"}).status_code == 401
+    assert client.get("/api/v1/contracts", headers={"X-API-Key": ""}).status_code in (401, 403)
+
+
+def test_registry_accepts_every_configured_key(monkeypatch, tmp_path):
+    keys_file = tmp_path / "keys"
+    keys_file.write_text(f"# rotated in March\nci:{hash_api_key('from-file')}\n")
+    monkeypatch.setenv("GDEV_API_TOKEN", "plain")
+    monkeypatch.setenv("GDEV_API_KEYS", f"mobile:{hash_api_key('from-env')}")
+    monkeypatch.setenv("GDEV_API_KEYS_FILE", str(keys_file))
+    registry = APIKeyRegistry()
+    assert registry.verify("plain") == "default"
+    assert registry.verify("from-env") == "mobile"
+    assert registry.verify("from-file") == "ci"
+    assert registry.verify("nope") is None
@@ -0,0 +1,35 @@
+"""Bulk create endpoints: all-or-nothing, with the failing item's index in the 422."""
+
+from .helpers import make_contract
+
+CONTRACT = {"title": "Bulk", "type": "nda", "counterparty": "Acme"}
+
+
+def test_bulk_create_returns_items_in_request_order(client):
+    payload = [{**CONTRACT, "title": f"Bulk {n}"} for n in range(3)]
+    resp = client.post("/api/v1/contracts/bulk", json=payload)
+    assert resp.status_code == 201
+    created = resp.json()
+    assert [c["title"] for c in created] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert created[0]["id"] < created[1]["id"] < created[2]["id"]
+
+
+def test_invalid_item_is_reported_by_index_and_nothing_is_inserted(client):
+    payload = [CONTRACT, {**CONTRACT, "type": "handshake"}, CONTRACT]
+    resp = client.post("/api/v1/contracts/bulk", json=payload)
+    assert resp.status_code == 422
+    assert [error["loc"] for error in resp.json()["detail"]] == [["body", 1, "type"]]
+    assert client.get("/api/v1/contracts").json()["items"] == []
+
+
+def test_clause_with_unknown_contract_is_reported_by_index(client):
+    contract = make_contract(client)
+    clause = {"contract_id": contract["id"], "type": "payment", "text": "Net 30"}
+    resp = client.post("/api/v1/clauses/bulk", json=[clause, clause, {**clause, "contract_id": 999999}])
+    assert resp.status_code == 422
+    assert [error["loc"] for error in resp.json()["detail"]] == [["body", 2, "contract_id"]]
+    assert client.get("/api/v1/clauses").json()["items"] == []
+
+
+def test_empty_batch_is_rejected(client):
+    assert client.post("/api/v1/notes/bulk", json=[]).status_code == 422
@@ -0,0 +1,74 @@
+"""Conditional requests: ETags, 304s and If-Match on PATCH."""
+
+from .helpers import make_contract
+
+
+def test_get_returns_a_strong_etag_and_304(client):
+    contract = make_contract(client)
+    resp = client.get(f"/api/v1/contracts/{contract['id']}")
+    etag = resp.headers["ETag"]
+    assert etag.startswith('"') and "Last-Modified" in resp.headers
+    cached = client.get(f"/api/v1/contracts/{contract['id']}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+
+
+def test_sparse_representations_have_their_own_etags(client):
+    contract = make_contract(client)
+    path = f"/api/v1/contracts/{contract['id']}"
+    full = client.get(path).headers["ETag"]
+    title = client.get(path, params={"fields": "title"}).headers["ETag"]
+    counterparty = client.get(path, params={"fields": "counterparty"}).headers["ETag"]
+    assert len({full, title, counterparty}) == 3
+    # The full representation's tag does not validate a sparse one
+    assert client.get(path, params={"fields": "title"}, headers={"If-None-Match": full}).status_code == 200
+    assert client.get(path, params={"fields": "title"}, headers={"If-None-Match": title}).status_code == 304
+
+
+def test_list_etags_depend_on_fields_and_rows(client):
+    make_contract(client)
+    page = client.get("/api/v1/contracts")
+    etag = page.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert client.get("/api/v1/contracts", headers={"If-None-Match": etag}).status_code == 304
+    sparse = client.get("/api/v1/contracts", params={"fields": "title"}, headers={"If-None-Match": etag})
+    assert sparse.status_code == 200
+    make_contract(client, title="Another")
+    assert client.get("/api/v1/contracts", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_patch_with_if_match(client):
+    contract = make_contract(client)
+    path = f"/api/v1/contracts/{contract['id']}"
+    etag = client.get(path).headers["ETag"]
+
+    resp = client.patch(path, json={"title": "Renamed"}, headers={"If-Match": etag})
+    assert resp.status_code == 200 and resp.json()["title"] == "Renamed"
+    new_etag = resp.headers["ETag"]
+    assert new_etag.startswith('"')
+
+    # A version the row no longer has, and weak tags, never match
+    assert client.patch(path, json={"title": "Stale"}, headers={"If-Match": '"1"'}).status_code == 412
+    assert client.patch(path, json={"title": "Weak"}, headers={"If-Match": f"W/{new_etag}"}).status_code == 412
+    assert client.patch(path, json={"title": "Any"}, headers={"If-Match": "*"}).status_code == 200
+
+
+def test_patch_accepts_a_sparse_tag_for_the_current_version(client):
+    contract = make_contract(client)
+    path = f"/api/v1/contracts/{contract['id']}"
+    etag = client.get(path, params={"fields": "title"}).headers["ETag"]
+    assert client.patch(path, json={"title": "Renamed"}, headers={"If-Match": etag}).status_code == 200
+
+
+def test_patch_missing_row_is_404_even_with_if_match(client):
+    assert client.patch("/api/v1/contracts/999999", json={"title": "x"}, headers={"If-Match": "*"}).status_code == 404
+
+
+def test_compliance_item_etags(client):
+    item = client.post(
+        "/api/v1/compliance", json={"title": "SOC 2", "category": "certification", "status": "pending"}
+    ).json()
+    path = f"/api/v1/compliance/{item['id']}"
+    etag = client.get(path).headers["ETag"]
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(path, params={"fields": "title"}).headers["ETag"] != etag
+    assert client.patch(path, json={"status": "compliant"}, headers={"If-Match": '"1"'}).status_code == 412
@@ -0,0 +1,36 @@
+"""Sparse fieldsets (fields=), list views without large text, and include= embeds."""
+
+from .helpers import make_contract, make_note
+
+
+def test_fields_selects_only_the_named_fields_plus_id(client):
+    contract = make_contract(client, summary="Long text")
+    assert client.get(f"/api/v1/contracts/{contract['id']}", params={"fields": "title"}).json() == {
+        "id": contract["id"],
+        "title": contract["title"],
+    }
+    items = client.get("/api/v1/contracts", params={"fields": "title,summary"}).json()["items"]
+    assert items == [{"id": contract["id"], "title": contract["title"], "summary": "Long text"}]
+
+
+def test_list_views_leave_out_large_text_unless_asked(client):
+    contract = make_contract(client, summary="Long text")
+    item = client.get("/api/v1/contracts").json()["items"][0]
+    assert "summary" not in item and item["title"] == contract["title"]
+    assert client.get(f"/api/v1/contracts/{contract['id']}").json()["summary"] == "Long text"
+
+
+def test_unknown_field_is_a_400(client):
+    assert client.get("/api/v1/notes", params={"fields": "content,colour"}).status_code == 400
+
+
+def test_include_embeds_clauses_and_notes(client):
+    contract = make_contract(client)
+    client.post("/api/v1/clauses", json={"contract_id": contract["id"], "type": "payment", "text": "Net 30"})
+    make_note(client, reference_type="contract", reference_id=contract["id"])
+    body = client.get(f"/api/v1/contracts/{contract['id']}", params={"include": "clauses,notes"}).json()
+    assert [c["text"] for c in body["clauses"]] == ["Net 30"]
+    assert [n["reference_id"] for n in body["notes"]] == [contract["id"]]
+    listed = client.get("/api/v1/contracts", params={"include": "clauses"}).json()["items"]
+    assert len(listed[0]["clauses"]) == 1
+    assert client.get("/api/v1/contracts", params={"include": "parties"}).status_code == 400
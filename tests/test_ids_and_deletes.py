@@ -0,0 +1,54 @@
+"""ids= batch lookups with missing_ids, and set-based contract deletes."""
+
+from .helpers import make_contract, make_note
+
+
+def test_ids_returns_rows_in_request_order_and_lists_missing_ones(client):
+    a, b = make_contract(client)["id"], make_contract(client)["id"]
+    body = client.get("/api/v1/contracts", params={"ids": f"{b},999999,{a}"}).json()
+    assert [c["id"] for c in body["items"]] == [b, a]
+    assert body["missing_ids"] == [999999]
+    assert body["next_cursor"] is None
+
+
+def test_ids_still_apply_the_other_filters(client):
+    active = make_contract(client, status="active")["id"]
+    draft = make_contract(client, status="draft")["id"]
+    body = client.get("/api/v1/contracts", params={"ids": f"{active},{draft}", "status": "active"}).json()
+    assert [c["id"] for c in body["items"]] == [active]
+    assert body["missing_ids"] == [draft]
+
+
+def test_missing_ids_only_appears_on_id_lookups(client):
+    make_contract(client)
+    assert "missing_ids" not in client.get("/api/v1/contracts").json()
+
+
+def test_malformed_ids_are_a_400(client):
+    assert client.get("/api/v1/notes", params={"ids": "1,x"}).status_code == 400
+    assert client.get("/api/v1/notes", params={"ids": ","}).status_code == 400
+
+
+def test_delete_requires_a_filter(client):
+    assert client.delete("/api/v1/contracts").status_code == 400
+
+
+def test_delete_by_status_removes_clauses_and_notes(client):
+    doomed = make_contract(client, status="terminated")
+    kept = make_contract(client, status="active")
+    for contract in (doomed, kept):
+        client.post("/api/v1/clauses", json={"contract_id": contract["id"], "type": "payment", "text": "Net 30"})
+        make_note(client, reference_type="contract", reference_id=contract["id"])
+
+    resp = client.delete("/api/v1/contracts", params={"status": "terminated"})
+    assert resp.status_code == 200 and resp.json() == {"deleted": 1}
+    assert [c["id"] for c in client.get("/api/v1/contracts").json()["items"]] == [kept["id"]]
+    assert {c["contract_id"] for c in client.get("/api/v1/clauses").json()["items"]} == {kept["id"]}
+    assert {n["reference_id"] for n in client.get("/api/v1/notes").json()["items"]} == {kept["id"]}
+
+
+def test_delete_by_ids(client):
+    a, b = make_contract(client)["id"], make_contract(client)["id"]
+    assert client.delete("/api/v1/contracts", params={"ids": f"{a},999999"}).json() == {"deleted": 1}
+    assert client.get(f"/api/v1/contracts/{a}").status_code == 404
+    assert client.get(f"/api/v1/contracts/{b}").status_code == 200
@@ -0,0 +1,58 @@
+"""CSV imports (invalid rows reported, not loaded) and streaming CSV/NDJSON exports."""
+
+import csv
+import io
+import json
+
+from .helpers import make_contract
+
+
+def _upload(client, entity: str, text: str):
+    return client.post(f"/api/v1/import/{entity}", files={"file": (f"{entity}.csv", text.encode(), "text/csv")})
+
+
+def test_import_loads_valid_rows_and_reports_invalid_ones(client):
+    resp = _upload(
+        client,
+        "contracts",
+        "title,type,counterparty,value\n"
+        "Lease,lease,Landlord,1200\n"
+        "Broken,handshake,Nobody,\n"
+        "NDA,nda,Acme,\n",
+    )
+    assert resp.status_code == 200
+    report = resp.json()
+    assert (report["processed"], report["imported"], report["rejected"]) == (3, 2, 1)
+    assert report["errors"][0]["line"] == 3 and report["errors"][0]["errors"][0].startswith("type")
+    titles = {c["title"] for c in client.get("/api/v1/contracts").json()["items"]}
+    assert titles == {"Lease", "NDA"}
+
+
+def test_import_rejects_clauses_of_unknown_contracts(client):
+    contract = make_contract(client)
+    report = _upload(
+        client, "clauses", f"contract_id,type,text\n{contract['id']},payment,Net 30\n999999,payment,Net 60\n"
+    ).json()
+    assert (report["imported"], report["rejected"]) == (1, 1)
+    assert report["errors"][0]["line"] == 3
+
+
+def test_unknown_import_entity_is_a_422(client):
+    assert _upload(client, "notes", "content\nx\n").status_code == 422
+
+
+def test_csv_export_streams_every_row(client):
+    ids = [make_contract(client, title=f"Contract {n}")["id"] for n in range(3)]
+    resp = client.get("/api/v1/export/contracts")
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [int(r["id"]) for r in rows] == ids
+    assert rows[0]["title"] == "Contract 0"
+
+
+def test_ndjson_export_applies_filters(client):
+    make_contract(client, status="active")
+    make_contract(client, status="draft")
+    resp = client.get("/api/v1/export/contracts", params={"format": "ndjson", "status": "active"})
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line)["status"] for line in resp.text.splitlines()] == ["active"]
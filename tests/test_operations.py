@@ -0,0 +1,64 @@
+"""Dashboards, pool and SQL instrumentation, metrics, and read-replica routing flags."""
+
+from datetime import date, timedelta
+
+from starlette.requests import Request
+
+from app.database import reads_from_primary
+
+from .helpers import make_contract
+
+
+def test_dashboard_counts_and_invalidation(client):
+    soon = (date.today() + timedelta(days=10)).isoformat()
+    make_contract(client, status="active", value=100.0, end_date=soon)
+    overdue = (date.today() - timedelta(days=1)).isoformat()
+    client.post(
+        "/api/v1/compliance", json={"title": "Audit", "category": "policy", "status": "pending", "due_date": overdue}
+    )
+    body = client.get("/api/v1/dashboard").json()
+    assert body["active_contracts_count"] == 1
+    assert body["total_contract_value"] == 100.0
+    assert body["expiring_soon_count"] == 1
+    assert body["compliance_status"]["pending"] == 1
+    assert body["overdue_compliance_items"] == 1
+
+    # A write drops the cached figures
+    make_contract(client, status="active", value=50.0)
+    assert client.get("/api/v1/dashboard").json()["active_contracts_count"] == 2
+
+
+def test_root_dashboard_revalidates_with_its_etag(client):
+    resp = client.get("/")
+    assert resp.status_code == 200 and "Cache-Control" in resp.headers
+    cached = client.get("/", headers={"If-None-Match": resp.headers["ETag"]})
+    assert cached.status_code == 304 and "Cache-Control" in cached.headers
+
+
+def test_responses_carry_server_timing(client):
+    resp = client.get("/api/v1/contracts")
+    assert "db;dur=" in resp.headers["Server-Timing"]
+
+
+def test_pool_stats_and_metrics(client):
+    client.get("/api/v1/contracts")
+    stats = client.get("/health/pool").json()
+    # SQLite keeps its own pool, so checkouts are only counted on other databases
+    assert stats["checkouts"] >= 0 and "+Inf" in stats["wait_ms_buckets"]
+    metrics = client.get("/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/contracts"}' in metrics
+
+
+def _request(headers=(), cookie=None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers]
+    if cookie:
+        raw.append((b"cookie", cookie.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw, "query_string": b""})
+
+
+def test_reads_from_primary_flags():
+    assert not reads_from_primary(_request())
+    assert reads_from_primary(_request([("X-Read-Primary", "1")]))
+    assert reads_from_primary(_request([("X-Read-Primary", "true")]))
+    assert not reads_from_primary(_request([("X-Read-Primary", "0")]))
+    assert reads_from_primary(_request(cookie="read_primary=1"))
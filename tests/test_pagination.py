@@ -0,0 +1,88 @@
+"""Keyset pagination: walking every page returns every row exactly once, in order."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app.models import Clause, ComplianceItem, Contract, LegalContact, LegalNote
+
+from .helpers import make_contract, make_note, walk
+
+
+def _flatten(pages):
+    return [row_id for page in pages for row_id in page]
+
+
+def test_contracts_created_in_the_same_second(client):
+    # CURRENT_TIMESTAMP rows: one created_at for all, so the id tie-break decides
+    ids = [make_contract(client, title=f"Contract {n}")["id"] for n in range(7)]
+    pages = walk(client, "/api/v1/contracts", limit=2)
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert _flatten(pages) == sorted(ids, reverse=True)
+
+
+def test_notes_created_in_the_same_second(client):
+    ids = [make_note(client, content=f"Note {n}")["id"] for n in range(5)]
+    assert _flatten(walk(client, "/api/v1/notes", limit=2)) == sorted(ids, reverse=True)
+
+
+def test_contracts_with_fractional_timestamps(client, db):
+    # Bound timestamps (as datagen and imports write them) mixed with CURRENT_TIMESTAMP ones
+    base = datetime(2024, 5, 1, 12, 0, 0)
+    rows = [
+        {"title": f"Imported {n}", "type": "nda", "status": "draft", "counterparty": "Acme",
+         "auto_renew": False, "currency": "USD", "created_at": base + timedelta(microseconds=250_000 * n)}
+        for n in range(5)
+    ]
+    db.execute(insert(Contract), rows)
+    db.commit()
+    make_contract(client, title="New")
+    pages = walk(client, "/api/v1/contracts", limit=2)
+    titles = {c["id"]: c["title"] for c in client.get("/api/v1/contracts", params={"limit": 100}).json()["items"]}
+    assert [titles[i] for i in _flatten(pages)] == ["New", *(f"Imported {n}" for n in reversed(range(5)))]
+
+
+@pytest.mark.parametrize("path", ["/api/v1/clauses", "/api/v1/compliance", "/api/v1/contacts"])
+def test_every_list_endpoint_walks_to_the_end(client, db, path):
+    contract = make_contract(client)
+    db.execute(insert(Clause), [
+        {"contract_id": contract["id"], "type": "payment", "text": f"Clause {n}", "risk_level": "low"}
+        for n in range(5)
+    ])
+    db.execute(insert(ComplianceItem), [
+        {"title": f"Item {n}", "category": "policy", "status": "pending",
+         "due_date": None if n % 2 else datetime(2025, 1, 1 + n).date()}
+        for n in range(5)
+    ])
+    db.execute(insert(LegalContact), [{"name": f"Contact {n % 2}", "role": "attorney"} for n in range(5)])
+    db.commit()
+    ids = _flatten(walk(client, path, limit=2))
+    assert len(ids) == len(set(ids)) == 5
+
+
+def test_contract_clauses_walk_to_the_end(client, db):
+    contract = make_contract(client)
+    db.execute(insert(Clause), [
+        {"contract_id": contract["id"], "type": "payment", "text": f"Clause {n}", "risk_level": "low"}
+        for n in range(5)
+    ])
+    db.commit()
+    ids = _flatten(walk(client, f"/api/v1/contracts/{contract['id']}/clauses", limit=2))
+    assert ids == sorted(ids) and len(ids) == 5
+
+
+def test_invalid_cursor_is_a_400(client):
+    assert client.get("/api/v1/contracts", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/v1/notes", params={"cursor": "WyJ4Il0"}).status_code == 400
+
+
+def test_note_rows_inserted_directly(client, db):
+    db.execute(insert(LegalNote), [
+        {"reference_type": "general", "content": f"N{n}", "author": "A",
+         "created_at": datetime(2024, 1, 1) + timedelta(seconds=n // 2, microseconds=n * 10)}
+        for n in range(6)
+    ])
+    db.commit()
+    ids = _flatten(walk(client, "/api/v1/notes", limit=4))
+    assert len(ids) == len(set(ids)) == 6
@@ -0,0 +1,133 @@
+"""Query plans: no list, get or search request has to read a whole table.
+
+Each request is sent through the app while every SELECT it issues is
+captured, so the plans checked are those of the SQL the routers actually
+emit (sparse projections, ETag probes, include= loads...). Each captured
+statement is then EXPLAINed with its own parameters, on the scratch
+database the other tests use.
+
+On PostgreSQL sequential scans are disabled for the EXPLAIN
+(``enable_seqscan = off``), so the planner only picks one when no index can
+serve the query at all, which is the plan a large table would get. On
+SQLite a bare ``SCAN <table>`` is reported when the rows also need a
+temporary B-tree to sort: a plain SCAN walks the rowid B-tree, which is
+already the primary-key order.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import event, text
+
+from app.database import engine
+from app.models import Base
+
+from .helpers import make_contract, make_note
+
+TABLES = {table.name for table in Base.metadata.sorted_tables}
+
+# (path, params); {contract} is replaced with the id of a real contract
+REQUESTS = [
+    ("/api/v1/contracts", {}),
+    ("/api/v1/contracts", {"status": "active"}),
+    ("/api/v1/contracts", {"expiring_within": 30}),
+    ("/api/v1/contracts", {"fields": "title,status"}),
+    ("/api/v1/contracts", {"include": "clauses,notes"}),
+    ("/api/v1/contracts", {"ids": "{contract}"}),
+    ("/api/v1/contracts/{contract}", {}),
+    ("/api/v1/contracts/{contract}", {"include": "clauses,notes"}),
+    ("/api/v1/contracts/{contract}/clauses", {}),
+    ("/api/v1/clauses", {}),
+    ("/api/v1/clauses", {"contract_id": "{contract}"}),
+    ("/api/v1/clauses", {"risk_level": "high"}),
+    ("/api/v1/compliance", {}),
+    ("/api/v1/compliance", {"status": "pending"}),
+    ("/api/v1/compliance", {"category": "license"}),
+    ("/api/v1/compliance", {"due_within": 30}),
+    ("/api/v1/contacts", {}),
+    ("/api/v1/contacts", {"role": "attorney"}),
+    ("/api/v1/notes", {}),
+    ("/api/v1/notes", {"reference_type": "contract", "reference_id": "{contract}"}),
+    ("/api/v1/search", {"q": "termination"}),
+]
+# Substring filters can only use an index with pg_trgm on PostgreSQL
+MATCH_REQUESTS = [
+    ("/api/v1/contracts", {"title": "cloud"}),
+    ("/api/v1/contacts", {"name": "smith"}),
+    ("/api/v1/notes", {"author": "dana"}),
+]
+
+
+def _has_trigram() -> bool:
+    if engine.dialect.name != "postgresql":
+        return True
+    with engine.connect() as conn:
+        return conn.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")) is not None
+
+
+def _pg_seq_scans(plan: dict) -> list:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_pg_seq_scans(child))
+    return found
+
+
+def _sqlite_seq_scans(details: list) -> list:
+    if not any(d.startswith("USE TEMP B-TREE") for d in details):
+        return []
+    found = []
+    for detail in details:
+        words = detail.split()
+        if len(words) >= 2 and words[0] == "SCAN" and words[1] in TABLES and "INDEX" not in words:
+            found.append(words[1])
+    return found
+
+
+def seq_scans(statement: str, parameters) -> list:
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            plan = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return _pg_seq_scans(plan[0]["Plan"])
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+        return _sqlite_seq_scans([row[-1] for row in rows])
+
+
+@pytest.fixture
+def contract_id(client):
+    contract = make_contract(client, summary="Termination for convenience")
+    make_note(client, reference_type="contract", reference_id=contract["id"])
+    return contract["id"]
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    REQUESTS + [pytest.param(*r, marks=pytest.mark.skipif("not _has_trigram()")) for r in MATCH_REQUESTS],
+)
+def test_request_never_scans_a_whole_table(client, contract_id, path, params):
+    path = path.format(contract=contract_id)
+    params = {k: str(v).format(contract=contract_id) for k, v in params.items()}
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        resp = client.get(path, params=params, headers={"If-None-Match": '"probe"'})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert resp.status_code == 200, resp.text
+    assert statements, f"{path} ran no SELECT"
+
+    regressions = {}
+    for statement, parameters in statements:
+        scans = seq_scans(statement, parameters)
+        if scans:
+            regressions[statement] = scans
+    assert not regressions, f"{path} {params} sequentially scans: {regressions}"
@@ -0,0 +1,39 @@
+"""Full-text search: ranked hits, offset cursors and cursor validation."""
+
+import pytest
+
+from .helpers import make_contract, make_note, walk
+
+
+def test_search_finds_summaries_and_notes(client):
+    contract = make_contract(client, summary="Termination for convenience with thirty days notice")
+    note = make_note(client, content="Termination notice sent to the counterparty")
+    make_note(client, content="Unrelated reminder")
+    hits = client.get("/api/v1/search", params={"q": "termination"}).json()["items"]
+    assert {(h["entity"], h["id"]) for h in hits} == {("contract", contract["id"]), ("note", note["id"])}
+    assert all("<mark>" in h["snippet"].lower() for h in hits)
+
+
+def test_search_pages_cover_every_hit_once(client):
+    for n in range(5):
+        make_note(client, content=f"Renewal reminder number {n}")
+    pages = walk(client, "/api/v1/search", q="renewal", limit=2)
+    ids = [i for page in pages for i in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len(set(ids)) == 5
+
+
+@pytest.mark.parametrize("cursor", ["WyItNSJd", "WyJ4Il0", "WzEsMl0", "%%%"])
+def test_bad_search_cursor_is_a_400(client, cursor):
+    # WyItNSJd is ["-5"]: a negative offset must not reach the database
+    assert client.get("/api/v1/search", params={"q": "renewal", "cursor": cursor}).status_code == 400
+
+
+def test_substring_filters_match_inside_names(client):
+    for name in ("Jane Smithers", "Ann Blacksmith", "Bob Jones"):
+        assert client.post("/api/v1/contacts", json={"name": name, "role": "attorney"}).status_code == 201
+    names = {c["name"] for c in client.get("/api/v1/contacts", params={"name": "smith"}).json()["items"]}
+    assert names == {"Jane Smithers", "Ann Blacksmith"}
+    # Fuzzy matching falls back to substring matching where pg_trgm is unavailable
+    fuzzy = client.get("/api/v1/contacts", params={"name": "smith", "match": "fuzzy"})
+    assert fuzzy.status_code == 200 and "Bob Jones" not in {c["name"] for c in fuzzy.json()["items"]}